@@ -18,6 +18,13 @@ from typing import TYPE_CHECKING
 
 from ..core.paths import STAGING_INBOX
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 if TYPE_CHECKING:
     from .context import ContextInjector
 
@@ -63,8 +70,6 @@ async def collect_response(agent: "Agent", text: str, *, owner: str = "") -> str
     text deltas.  Used by channels and nudge — voice has its own
     streaming loop with interrupt/TTS handling.
     """
-    from contextlib import aclosing
-
     chunks: list[str] = []
     async with aclosing(agent.send(text, owner=owner)) as stream:
         async for event in stream:
@@ -96,10 +101,21 @@ class Agent:
         self._thinking = config.thinking
         self._session_file = config.project_dir / "pi-session.jsonl"
 
+        # Spawn command and cwd are fixed per agent -- build them once
+        cmd = ["pi", "--mode", "rpc", "--session", str(self._session_file)]
+        if self._model:
+            cmd.extend(["--model", self._model])
+        if self._thinking:
+            cmd.extend(["--thinking", self._thinking])
+        self._spawn_cmd = tuple(cmd)
+        self._spawn_cwd = str(self._project_dir)
+
         self._connected = False
         self._lock = asyncio.Lock()
         self._send_lock = asyncio.Lock()
         self._send_owner: str | None = None
+        # In-flight connect shared by concurrent callers (single-flight)
+        self._connect_task: asyncio.Task | None = None
 
         # ContextInjector -- set by daemon after construction
         self.context: "ContextInjector | None" = None
@@ -148,9 +164,20 @@ class Agent:
     # ------------------------------------------------------------------
 
     async def connect(self) -> None:
-        """Spawn Pi RPC subprocess if not already connected."""
+        """Spawn Pi RPC subprocess if not already connected.
+
+        Concurrent callers (voice prep, channel messages, eager startup)
+        share one in-flight connect instead of queueing on the lock and
+        each waiting out its own spawn.
+        """
         if self._connected:
             return
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = asyncio.create_task(self._connect())
+        # Shielded so one cancelled waiter doesn't abort the spawn for the rest
+        await asyncio.shield(self._connect_task)
+
+    async def _connect(self) -> None:
         async with self._lock:
             if self._connected:
                 return
@@ -161,20 +188,14 @@ class Agent:
                 self._project_dir,
             )
 
-            self.ensure_project_dir()
-
-            cmd = ["pi", "--mode", "rpc", "--session", str(self._session_file)]
-            if self._model:
-                cmd.extend(["--model", self._model])
-            if self._thinking:
-                cmd.extend(["--thinking", self._thinking])
+            await asyncio.to_thread(self.ensure_project_dir)
 
             self._process = await asyncio.create_subprocess_exec(
-                *cmd,
+                *self._spawn_cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=str(self._project_dir),
+                cwd=self._spawn_cwd,
                 limit=1024 * 1024 * 1024,  # 1GB — Pi responses (get_messages) can be arbitrarily large
             )
 
@@ -432,8 +453,8 @@ class Agent:
                     break
 
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
+                    data = _loads(line)
+                except ValueError:
                     continue
 
                 await self._events.put(data)
@@ -453,7 +474,10 @@ class Agent:
                 line = await self._process.stderr.readline()
                 if not line:
                     break
-                msg = line.decode().rstrip()
+                # Drain regardless, but only decode lines that will be logged
+                if not logger.isEnabledFor(logging.DEBUG):
+                    continue
+                msg = line.decode(errors="replace").rstrip()
                 if msg:
                     logger.debug("[pi] %s", msg)
         except asyncio.CancelledError:
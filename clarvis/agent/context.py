@@ -5,6 +5,7 @@ to agent prompts.  Memory grounding is handled separately by
 ``Agent._inject_grounding()`` at session reset — not here.
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -49,7 +50,9 @@ class ContextInjector:
         parts: list[str] = []
 
         if include_ambient:
-            ambient = build_ambient_context(self._state)
+            # Now-playing may hit the Spotify session (first use runs a
+            # network health check) -- keep it off the event loop.
+            ambient = await asyncio.to_thread(build_ambient_context, self._state)
             if ambient:
                 parts.append(ambient)
 
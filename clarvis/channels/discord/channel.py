@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import random
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
 MAX_ATTACHMENT_BYTES = 20 * 1024 * 1024  # 20MB
+# Gateway reconnect backoff: doubles per consecutive failure, plus up to 50% jitter
+RECONNECT_BASE_DELAY = 5.0
+RECONNECT_MAX_DELAY = 120.0
 
 
 @dataclass
@@ -45,8 +49,12 @@ class DiscordChannel(BaseChannel):
         self._heartbeat_task: asyncio.Task | None = None
         self._typing_tasks: dict[str, asyncio.Task] = {}
         self._http: httpx.AsyncClient | None = None
+        # REST auth header, built once and passed per request so attachment
+        # downloads from the CDN on the same client never carry the token
+        self._auth_headers = {"Authorization": f"Bot {config.token}"}
         self._bot_user_id: str | None = None
         self._bot_username: str | None = None
+        self._gateway_ready = False  # READY seen on the current connection
 
     async def start(self) -> None:
         """Start the Discord gateway connection."""
@@ -57,7 +65,9 @@ class DiscordChannel(BaseChannel):
         self._running = True
         self._http = httpx.AsyncClient(timeout=10.0)
 
+        delay = RECONNECT_BASE_DELAY
         while self._running:
+            self._gateway_ready = False
             try:
                 logger.info("Connecting to Discord gateway...")
                 async with websockets.connect(self.config.gateway_url) as ws:
@@ -67,9 +77,15 @@ class DiscordChannel(BaseChannel):
                 break
             except Exception as e:
                 logger.warning("Discord gateway error: %s", e)
+                # Only a session that reached READY resets the backoff --
+                # connect-then-close loops (bad token, 4004/4014) keep growing
+                if self._gateway_ready:
+                    delay = RECONNECT_BASE_DELAY
                 if self._running:
-                    logger.info("Reconnecting to Discord gateway in 5 seconds...")
-                    await asyncio.sleep(5)
+                    wait = delay + random.uniform(0, delay * 0.5)
+                    logger.info("Reconnecting to Discord gateway in %.1f seconds...", wait)
+                    await asyncio.sleep(wait)
+                    delay = min(delay * 2, RECONNECT_MAX_DELAY)
 
     async def stop(self) -> None:
         """Stop the Discord channel."""
@@ -96,12 +112,10 @@ class DiscordChannel(BaseChannel):
         url = f"{DISCORD_API_BASE}/channels/{msg.chat_id}/messages"
         payload: dict[str, Any] = {"content": msg.content}
 
-        headers = {"Authorization": f"Bot {self.config.token}"}
-
         try:
             for attempt in range(3):
                 try:
-                    response = await self._http.post(url, headers=headers, json=payload)
+                    response = await self._http.post(url, headers=self._auth_headers, json=payload)
                     if response.status_code == 429:
                         data = response.json()
                         retry_after = float(data.get("retry_after", 1.0))
@@ -147,6 +161,7 @@ class DiscordChannel(BaseChannel):
                 bot_user = payload.get("user") or {}
                 self._bot_user_id = bot_user.get("id")
                 self._bot_username = bot_user.get("username")
+                self._gateway_ready = True
                 logger.info(
                     "Discord gateway READY (bot: %s / %s)",
                     self._bot_username,
@@ -285,10 +300,9 @@ class DiscordChannel(BaseChannel):
 
         async def typing_loop() -> None:
             url = f"{DISCORD_API_BASE}/channels/{channel_id}/typing"
-            headers = {"Authorization": f"Bot {self.config.token}"}
             while self._running:
                 try:
-                    await self._http.post(url, headers=headers)
+                    await self._http.post(url, headers=self._auth_headers)
                 except Exception:
                     pass
                 await asyncio.sleep(8)
@@ -21,6 +21,17 @@ if TYPE_CHECKING:
     from ..agent.agent import Agent
     from .registry import UserRegistry
 
+try:
+    import orjson
+
+    def _transcript_line(entry: dict) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+
+    def _transcript_line(entry: dict) -> bytes:
+        return (json.dumps(entry, ensure_ascii=False) + "\n").encode()
+
+
 logger = logging.getLogger(__name__)
 
 OutboundHook = Callable[[str, InboundMessage], str]
@@ -57,8 +68,9 @@ class ChannelManager:
         self._outbound_hooks: dict[str, OutboundHook] = {}
         self._voice_channel = None
         self._transcript_path = agent_home("factoria") / "transcript.jsonl"
-        self._transcript_buf: list[str] = []
+        self._transcript_buf: list[bytes] = []
         self._transcript_flush_task: asyncio.Task | None = None
+        self._transcript_fd: int | None = None
 
     @property
     def bus(self) -> MessageBus:
@@ -94,7 +106,7 @@ class ChannelManager:
             "sender_name": sender_name or sender,
             "content": content,
         }
-        self._transcript_buf.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._transcript_buf.append(_transcript_line(entry))
         if self._transcript_flush_task is None or self._transcript_flush_task.done():
             self._transcript_flush_task = asyncio.create_task(self._flush_transcript())
 
@@ -106,11 +118,22 @@ class ChannelManager:
         lines = self._transcript_buf.copy()
         self._transcript_buf.clear()
         try:
-            with self._transcript_path.open("a") as f:
-                f.writelines(lines)
+            self._write_transcript(lines)
         except OSError:
             logger.debug("Failed to write transcript entries")
 
+    def _write_transcript(self, lines: list[bytes]) -> None:
+        """Append entries with a raw write on a long-lived ``O_APPEND`` fd."""
+        if self._transcript_fd is None:
+            self._transcript_fd = os.open(
+                self._transcript_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC,
+                0o644,
+            )
+        buf = memoryview(b"".join(lines))
+        while buf:
+            buf = buf[os.write(self._transcript_fd, buf) :]
+
     async def send_to_agent(self, text: str) -> str:
         """Send to agent -- lock is internal to Agent._send_inner()."""
         from ..agent.agent import collect_response
@@ -295,8 +318,10 @@ class ChannelManager:
 
     def _replace_discord_mentions(self, text: str, msg: InboundMessage) -> str:
         """Replace @Name patterns with Discord <@user_id> pings."""
+        if "@" not in text:
+            return text
         name_map = self._registry.all_name_mappings("discord")
-        for name, user_id in sorted(name_map.items(), key=lambda x: -len(x[0])):
+        for name, user_id in sorted(name_map.items(), key=lambda x: len(x[0]), reverse=True):
             text = text.replace(f"@{name}", f"<@{user_id}>")
         return text
 
@@ -357,14 +382,18 @@ class ChannelManager:
         if self._voice_channel:
             await self._voice_channel.stop()
 
+        self._registry.flush()
+
         # Flush any buffered transcript entries
         if self._transcript_buf:
             try:
-                with self._transcript_path.open("a") as f:
-                    f.writelines(self._transcript_buf)
+                self._write_transcript(self._transcript_buf)
                 self._transcript_buf.clear()
             except OSError:
                 pass
+        if self._transcript_fd is not None:
+            os.close(self._transcript_fd)
+            self._transcript_fd = None
 
         logger.info("ChannelManager stopped")
 
@@ -1,13 +1,16 @@
 """Global user registry — persistent identity store for cross-channel users.
 
 Stores user profiles with names, affiliations, and per-channel IDs in
-``~/.clarvis/registry.json``.  Thread-safe with auto-save on mutation.
+``~/.clarvis/registry.json``.  Thread-safe with auto-save on mutation;
+bursts of mutations are coalesced into one write.
 """
 
+import atexit
 import copy
 import logging
+import weakref
 from pathlib import Path
-from threading import RLock
+from threading import Lock, RLock, Timer
 from typing import Any
 
 from ..core.paths import CLARVIS_HOME
@@ -17,6 +20,18 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_PATH = CLARVIS_HOME / "registry.json"
 
+# Mutations within this many seconds of each other share one write.
+_SAVE_DELAY = 0.2
+
+# Live registries, flushed once at interpreter exit (weak so instances can die)
+_live_registries: "weakref.WeakSet[UserRegistry]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_registries() -> None:
+    for registry in list(_live_registries):
+        registry.flush()
+
 
 class UserRegistry:
     """Thread-safe persistent user registry.
@@ -39,12 +54,17 @@ class UserRegistry:
     def __init__(self, path: Path = _DEFAULT_PATH, admin_user_ids: list[str] | None = None):
         self._path = path
         self._lock = RLock()
+        # Serializes file writes so the last snapshot taken is the last written
+        self._write_lock = Lock()
         self._data: dict[str, Any] = {"users": {}}
         self._admin_user_ids: set[str] = set(admin_user_ids or [])
         # Reverse index: (channel, user_id) → username for O(1) lookup
         self._channel_index: dict[tuple[str, str], str] = {}
+        self._dirty = False
+        self._save_timer: Timer | None = None
         self.load()
         self._migrate_roles()
+        _live_registries.add(self)
 
     def load(self) -> None:
         """Load registry from disk."""
@@ -57,9 +77,42 @@ class UserRegistry:
             self._rebuild_index()
 
     def save(self) -> bool:
-        """Persist registry to disk atomically."""
+        """Persist registry to disk atomically.
+
+        Snapshots under the registry lock but writes outside it, so lookups
+        on the message path aren't blocked on disk I/O.  Call without
+        holding ``_lock``.
+        """
+        with self._write_lock:
+            with self._lock:
+                data = copy.deepcopy(self._data)
+            return json_save_atomic(self._path, data)
+
+    def flush(self) -> bool:
+        """Write pending mutations now instead of waiting for the debounce."""
         with self._lock:
-            return json_save_atomic(self._path, self._data)
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
+        if self.save():
+            return True
+        with self._lock:
+            self._dirty = True
+        return False
+
+    def _schedule_save(self) -> None:
+        """Mark dirty and arm the debounced write if none is pending. Caller must hold lock.
+
+        Later mutations ride on the pending timer -- its flush writes them too.
+        """
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = Timer(_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def _rebuild_index(self) -> None:
         """Rebuild reverse index from data. Caller must hold lock."""
@@ -89,7 +142,7 @@ class UserRegistry:
             if any(o.lower() == name.lower() for o in orgs):
                 return False
             orgs.append(name)
-            self.save()
+            self._schedule_save()
             return True
 
     def remove_org(self, name: str) -> bool:
@@ -100,7 +153,7 @@ class UserRegistry:
             for i, o in enumerate(orgs):
                 if o.lower() == lower:
                     orgs.pop(i)
-                    self.save()
+                    self._schedule_save()
                     return True
             return False
 
@@ -163,7 +216,7 @@ class UserRegistry:
                 self._channel_index[(channel, channel_user_id)] = username
             if "role" not in profile:
                 profile["role"] = self._role_for(profile)
-            self.save()
+            self._schedule_save()
 
     def unregister(self, channel: str, user_id: str) -> str | None:
         """Remove a user by their channel-specific ID.
@@ -181,7 +234,7 @@ class UserRegistry:
             profile.get("channels", {}).pop(channel, None)
             if not profile.get("channels"):
                 self._data["users"].pop(username, None)
-            self.save()
+            self._schedule_save()
             return username
 
     def is_registered(self, channel: str, user_id: str) -> bool:
@@ -216,7 +269,7 @@ class UserRegistry:
                 profile["role"] = self._role_for(profile)
                 changed = True
             if changed:
-                self.save()
+                self._schedule_save()
 
     def _role_for(self, profile: dict) -> str:
         """Determine role based on whether any channel user_id is in admin set."""
@@ -241,6 +294,6 @@ class UserRegistry:
             for uname, profile in self._data.get("users", {}).items():
                 if uname.lower() == lower:
                     profile["role"] = role
-                    self.save()
+                    self._schedule_save()
                     return True
         return False
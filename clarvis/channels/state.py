@@ -10,9 +10,10 @@ Schema::
     }
 """
 
+import copy
 import logging
 from pathlib import Path
-from threading import RLock
+from threading import Lock, RLock
 from typing import Any
 
 from ..core.paths import CLARVIS_HOME
@@ -29,7 +30,11 @@ class ChannelState:
     def __init__(self, path: Path = _DEFAULT_PATH):
         self._path = path
         self._lock = RLock()
+        # Serializes file writes so the last snapshot taken is the last written
+        self._write_lock = Lock()
         self._data: dict[str, dict[str, Any]] = {}
+        # channel → set of enabled chat IDs, mirrors the on-disk lists for O(1) lookup
+        self._enabled: dict[str, set[str]] = {}
         self._load()
 
     def _load(self) -> None:
@@ -40,35 +45,49 @@ class ChannelState:
                 self._data = raw
             else:
                 self._data = {}
+            self._enabled = {
+                channel: set(ch_data.get("enabled_chats", []))
+                for channel, ch_data in self._data.items()
+                if isinstance(ch_data, dict)
+            }
 
     def _save(self) -> bool:
-        """Persist state to disk atomically."""
-        with self._lock:
-            return json_save_atomic(self._path, self._data)
+        """Persist state to disk atomically.
+
+        Snapshots under the state lock but writes outside it, so lookups
+        aren't blocked on disk I/O.  Call without holding ``_lock``.
+        """
+        with self._write_lock:
+            with self._lock:
+                data = copy.deepcopy(self._data)
+            return json_save_atomic(self._path, data)
 
     def is_chat_enabled(self, channel: str, chat_id: str) -> bool:
         """Check if a chat is enabled on a channel."""
         with self._lock:
-            ch_data = self._data.get(channel, {})
-            return chat_id in ch_data.get("enabled_chats", [])
+            return chat_id in self._enabled.get(channel, ())
 
     def enable_chat(self, channel: str, chat_id: str) -> None:
         """Add a chat to the enabled list for a channel."""
         with self._lock:
+            enabled = self._enabled.setdefault(channel, set())
+            if chat_id in enabled:
+                return
+            enabled.add(chat_id)
             ch_data = self._data.setdefault(channel, {})
-            chats = ch_data.setdefault("enabled_chats", [])
-            if chat_id not in chats:
-                chats.append(chat_id)
-                self._save()
+            ch_data.setdefault("enabled_chats", []).append(chat_id)
+        self._save()
 
     def disable_chat(self, channel: str, chat_id: str) -> None:
         """Remove a chat from the enabled list for a channel."""
         with self._lock:
-            ch_data = self._data.get(channel, {})
-            chats = ch_data.get("enabled_chats", [])
-            if chat_id in chats:
-                chats.remove(chat_id)
-                self._save()
+            enabled = self._enabled.get(channel)
+            if not enabled or chat_id not in enabled:
+                return
+            enabled.discard(chat_id)
+            ch_data = self._data[channel]
+            ch_data["enabled_chats"] = [c for c in ch_data["enabled_chats"] if c != chat_id]
+        self._save()
 
     def enabled_chats(self, channel: str) -> list[str]:
         """Get list of enabled chat IDs for a channel."""
@@ -8,8 +8,9 @@ Current backends:
 """
 
 import asyncio
+import itertools
 import logging
-import uuid
+import secrets
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -99,6 +100,10 @@ class WidgetASRBackend(ASRBackend):
         self._socket = socket_server
         self._future: asyncio.Future[ASRResult] | None = None
         self._asr_id: str | None = None
+        # Random per-process prefix: the widget outlives daemon restarts, so a
+        # late reply to the previous daemon's "1" must not match ours
+        self._asr_prefix = secrets.token_hex(3)
+        self._asr_seq = itertools.count(1)
 
     # -- Widget message routing ------------------------------------
 
@@ -147,9 +152,9 @@ class WidgetASRBackend(ASRBackend):
         silence_timeout: float,
         language: str = "en-US",
     ) -> ASRResult:
-        from .orchestrator import StartASRCommand
+        from .orchestrator import StartASRCommand, StopASRCommand
 
-        self._asr_id = uuid.uuid4().hex[:12]
+        self._asr_id = f"{self._asr_prefix}-{next(self._asr_seq):x}"
         self._future = self._loop.create_future()
 
         cmd = StartASRCommand(
@@ -162,7 +167,15 @@ class WidgetASRBackend(ASRBackend):
 
         try:
             return await asyncio.wait_for(self._future, timeout=timeout + 2.0)
-        except (asyncio.TimeoutError, asyncio.CancelledError):
+        except asyncio.TimeoutError:
+            return ASRResult(success=False, error="timeout")
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                # Our caller is being cancelled -- stop the widget recognizer too
+                self._socket.send_command(StopASRCommand().to_message())
+                raise
+            # cancel() cancelled the future: report it like a timeout
             return ASRResult(success=False, error="timeout")
         finally:
             self._future = None
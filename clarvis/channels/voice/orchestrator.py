@@ -26,6 +26,8 @@ from contextlib import aclosing
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from ...display.colors import ColorDef, StatusColors
+
 if TYPE_CHECKING:
     from ...agent.agent import Agent
     from ...core.signals import SignalBus
@@ -42,6 +44,10 @@ AGENT_QUERY_TIMEOUT = 60.0
 # Maximum time to wait for the agent to become free before voice pipeline starts.
 AGENT_FREE_TIMEOUT = 10.0
 
+# Streamed text is coalesced to one voice_text write per interval.  The
+# display polls the store at ~3 FPS, so per-token writes are never seen.
+VOICE_TEXT_FLUSH_INTERVAL = 0.1
+
 
 # ----------------------------------------------------------------------
 # Pipeline state machine
@@ -156,6 +162,10 @@ class VoiceCommandOrchestrator:
         self._cancelled = False  # True when mic-off cancels the pipeline
         self._tts_proc: asyncio.subprocess.Process | None = None
         self._prev_display: str = ""  # Previous voice text for turn separator
+        self._voice_text_pending: tuple[str, list[str]] | None = None  # (prefix, chunks) awaiting flush
+        self._voice_text_handle: asyncio.TimerHandle | None = None
+        self._status_frames: dict[ColorDef, dict] = {}  # Keyed by color so theme switches stay correct
+        self._pending_status_frame: dict | None = None  # Last status pushed this loop tick
         self._prompt_reply_pending = False  # Set by voice:prompt_reply signal
         self._bus = bus
 
@@ -206,23 +216,36 @@ class VoiceCommandOrchestrator:
         # Auto-update StateStore for display-relevant states
         status_str = _STATE_TO_STATUS.get(target)
         if status_str is not None:
-            current = self.state.get("status") or {}
-            current["status"] = status_str
-            self.state.update("status", current, force=True)
+            current = self.state.peek("status")
+            if current.get("status") != status_str:
+                self.state.update("status", {**current, "status": status_str}, force=True)
             # Push immediate status update to widget (bypasses 3 FPS render loop)
             self._push_status_now(status_str)
 
         return True
 
     def _push_status_now(self, status: str) -> None:
-        """Send a lightweight status-only frame for instant visual feedback."""
-        from ...display.colors import StatusColors
+        """Send a lightweight status-only frame for instant visual feedback.
 
+        Pushes made within one event-loop tick (e.g. ACTIVATED then
+        LISTENING at pipeline start) coalesce into a single frame.
+        """
         color_def = StatusColors.get(status)
-        self.socket.push_frame({"theme_color": list(color_def.rgb)})
+        frame = self._status_frames.get(color_def)
+        if frame is None:
+            frame = self._status_frames[color_def] = {"theme_color": list(color_def.rgb)}
+        if self._pending_status_frame is None:
+            self._loop.call_soon(self._emit_status_frame)
+        self._pending_status_frame = frame
+
+    def _emit_status_frame(self) -> None:
+        frame, self._pending_status_frame = self._pending_status_frame, None
+        if frame is not None:
+            self.socket.push_frame(frame)
 
     def _set_voice_text(self, text: str, *, streaming: bool = True, tts_started_at: float = 0) -> None:
         """Update voice_text state for display."""
+        self._drop_pending_voice_text()
         self.state.update(
             "voice_text",
             {
@@ -236,8 +259,34 @@ class VoiceCommandOrchestrator:
 
     def _clear_voice_text(self) -> None:
         """Clear voice text from display."""
+        self._drop_pending_voice_text()
         self.state.update("voice_text", {"active": False})
 
+    def _stream_voice_text(self, prefix: str, chunks: list[str]) -> None:
+        """Coalesce streaming voice_text writes to one per flush interval.
+
+        *chunks* is the live response buffer; it is joined only when the
+        flush fires, not on every token.
+        """
+        self._voice_text_pending = (prefix, chunks)
+        if self._voice_text_handle is None:
+            self._voice_text_handle = self._loop.call_later(VOICE_TEXT_FLUSH_INTERVAL, self._flush_voice_text)
+
+    def _flush_voice_text(self) -> None:
+        """Write any pending streamed text now."""
+        pending = self._voice_text_pending
+        if pending is None:
+            self._drop_pending_voice_text()
+        else:
+            prefix, chunks = pending
+            self._set_voice_text(prefix + "".join(chunks))
+
+    def _drop_pending_voice_text(self) -> None:
+        self._voice_text_pending = None
+        if self._voice_text_handle is not None:
+            self._voice_text_handle.cancel()
+            self._voice_text_handle = None
+
     def _end_session(self) -> None:
         """Shared cleanup for all pipeline entry points (on_wake_word/notify/speak)."""
         self._interrupt.clear()
@@ -407,23 +456,34 @@ class VoiceCommandOrchestrator:
         self._play_sound("Tink")
         self.wake.mute()
 
-        # 2. Kick off agent connect in parallel
-        agent_task = asyncio.create_task(self.agent.connect())
-
-        # 3. Get the user's text -- either from ASR or from the supplied prompt
-        if prompt is not None:
-            # Programmatic path: skip ASR entirely
-            text = prompt
-            await asyncio.sleep(0.3)  # let activation sound play
-        else:
-            # ASR path: fire off speech recognition in parallel with prep
-            self._transition(VoicePipelineState.LISTENING)
-            result = await self._asr_backend.listen(
-                timeout=self.asr_timeout,
-                silence_timeout=self.silence_timeout,
-                language=self.asr_language,
-            )
-
+        # 2. Connect the agent alongside ASR. Leaving the group awaits the
+        #    connect (normally done by then); a failure cancels the other.
+        result = None
+        text = ""
+        async with asyncio.TaskGroup() as tg:
+            connect_task = tg.create_task(self.agent.connect())
+
+            # 3. Get the user's text -- either from ASR or from the supplied prompt
+            if prompt is not None:
+                # Programmatic path: skip ASR entirely
+                text = prompt
+                await asyncio.sleep(0.3)  # let activation sound play
+            else:
+                # ASR path: fire off speech recognition in parallel with prep
+                self._transition(VoicePipelineState.LISTENING)
+                result = await self._asr_backend.listen(
+                    timeout=self.asr_timeout,
+                    silence_timeout=self.silence_timeout,
+                    language=self.asr_language,
+                )
+                if result.success:
+                    text = (result.text or "").strip()
+                if not text:
+                    # Nothing to send -- don't hold the session open for a cold
+                    # spawn.  Agent.connect() shields it, so it keeps warming.
+                    connect_task.cancel()
+
+        if result is not None:
             if not result.success:
                 if not is_restart and not self._cancelled:
                     await self._visual_bail()
@@ -431,7 +491,6 @@ class VoiceCommandOrchestrator:
                     self._transition(VoicePipelineState.COOLDOWN)
                 return
 
-            text = (result.text or "").strip()
             if not text:
                 if not is_restart:
                     await self._visual_bail()
@@ -441,10 +500,7 @@ class VoiceCommandOrchestrator:
 
             logger.info("Voice command: %s", text)
 
-        # 4. Await agent connect (should already be done -- ran during ASR/sleep)
-        await agent_task
-
-        # 4b. Wait for agent to be free (nudge/chat may be holding the lock)
+        # 4. Wait for agent to be free (nudge/chat may be holding the lock)
         agent_free = await self._wait_for_agent_free()
         if not agent_free:
             self._transition(VoicePipelineState.COOLDOWN)
@@ -547,7 +603,7 @@ class VoiceCommandOrchestrator:
         t_query = time.monotonic()
         t_first_token = None
         response_buf: list[str] = []  # join only at tool boundaries and end
-        display_text = self._prev_display + "\n\n" if self._prev_display else ""
+        display_prefix = self._prev_display + "\n\n" if self._prev_display else ""
         all_spoken: list[str] = []
         interrupted = False
 
@@ -569,10 +625,7 @@ class VoiceCommandOrchestrator:
 
                         etype = event.get("type")
 
-                        if etype == "extension_ui_request":
-                            auto_approve_extension_ui(self.agent, event)
-                            continue
-
+                        # message_update carries every token -- test it first
                         if etype == "message_update":
                             delta = event.get("assistantMessageEvent", {})
                             if delta.get("type") == "text_delta":
@@ -581,8 +634,11 @@ class VoiceCommandOrchestrator:
                                     t_first_token = time.monotonic()
                                     hint_task.cancel()
                                 response_buf.append(chunk)
-                                display_text += chunk
-                                self._set_voice_text(display_text)
+                                self._stream_voice_text(display_prefix, response_buf)
+                            continue
+
+                        if etype == "extension_ui_request":
+                            auto_approve_extension_ui(self.agent, event)
                             continue
 
                         if etype == "tool_execution_end":
@@ -591,6 +647,7 @@ class VoiceCommandOrchestrator:
                                 segment = "".join(response_buf).strip()
                                 if segment:
                                     hint_task.cancel()
+                                    self._flush_voice_text()
                                     self._transition(VoicePipelineState.RESPONDING)
                                     await self._speak(segment)
                                     all_spoken.append(segment)
@@ -601,7 +658,7 @@ class VoiceCommandOrchestrator:
                                         interrupted = True
                                         break
                                 response_buf.clear()
-                                display_text = self._prev_display + "\n\n" if self._prev_display else ""
+                                display_prefix = self._prev_display + "\n\n" if self._prev_display else ""
                                 self._clear_voice_text()
                             # Back to thinking while tool executes
                             self._transition(VoicePipelineState.THINKING)
@@ -617,6 +674,7 @@ class VoiceCommandOrchestrator:
             return None
         finally:
             hint_task.cancel()
+            self._flush_voice_text()
 
         t_stream_done = time.monotonic()
 
@@ -105,13 +105,32 @@ def nudge(self: CommandHandlers, *, reason: str = "timer", **kw) -> dict:
         return {"error": str(exc)}
 
 
-def read_sessions(self: CommandHandlers, *, path: str, **kw) -> dict:
-    """Parse a Pi session JSONL file and return structured messages."""
+def read_sessions(
+    self: CommandHandlers,
+    *,
+    path: str | None = None,
+    paths: list[str] | None = None,
+    limit: int | None = None,
+    **kw,
+) -> dict:
+    """Parse Pi session JSONL file(s) and return structured messages (the last *limit* if given).
+
+    Pass ``paths`` to read several files in one call; they are parsed concurrently.
+    """
     from pathlib import Path
 
-    from ...memory.session_reader import parse_session
-
-    messages = parse_session(Path(path))
+    from ...memory.session_reader import parse_session, parse_sessions
+
+    if paths is not None:
+        parsed = parse_sessions([Path(p) for p in paths], limit=limit)
+        return {
+            "sessions": [
+                {"path": p, "messages": messages, "count": len(messages)} for p, messages in zip(paths, parsed)
+            ]
+        }
+    if path is None:
+        return {"error": "path or paths is required"}
+    messages = parse_session(Path(path), limit=limit)
     return {"messages": messages, "count": len(messages)}
 
 
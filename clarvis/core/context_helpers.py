@@ -6,6 +6,23 @@ time, weather, location, and now-playing as a newline-joined string.
 
 from datetime import datetime
 
+# Lowercase names for _time_summary -- avoids a locale-aware strftime per turn
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_MONTHS = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+
 
 def build_ambient_context(state, include_paused: bool = False) -> str:
     """Build ambient context string from StateStore.
@@ -46,7 +63,9 @@ def _time_summary(state: dict | None) -> str | None:
         dt = datetime.fromisoformat(state["timestamp"])
     except (ValueError, KeyError):
         return None
-    return dt.strftime("%A, %B %-d, %-I:%M%p").lower()
+    hour = dt.hour % 12 or 12
+    ampm = "am" if dt.hour < 12 else "pm"
+    return f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day}, {hour}:{dt.minute:02d}{ampm}"
 
 
 def _weather_summary(state: dict | None) -> str | None:
@@ -2,34 +2,99 @@
 
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode for newly created files -- what a plain open() would have given them
+_NEW_FILE_MODE = 0o666 & ~_umask()
+
+
 def json_save_atomic(path: Path, data: Any) -> bool:
     """Atomically save *data* as JSON via tmp-file + rename.
 
-    Creates parent directories if needed.  Returns ``True`` on success.
+    The tmp file is unique per call, takes the target's existing mode
+    (or the umask default for a new file), and is fsynced before the
+    rename; the directory is fsynced after it.  Concurrent saves can't
+    interleave and a crash leaves either the old or the new file, never
+    a truncated one.  Creates parent directories if needed.  Returns
+    ``True`` on success.
     """
+    tmp = None
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2))
-        tmp.replace(path)
+        payload = _dumps(data)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates 0600; keep the mode the file would otherwise have
+            os.fchmod(f.fileno(), _target_mode(path))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        _fsync_dir(path.parent)
         return True
     except OSError:
         logger.warning("Failed to save %s", path, exc_info=True)
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
         return False
 
 
+def _target_mode(path: Path) -> int:
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename in *directory*; best effort -- the file is already saved."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def json_load_safe(path: Path) -> Any | None:
     """Load JSON from *path*, returning ``None`` on missing/corrupt files."""
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
+        return _loads(path.read_bytes())
+    except (ValueError, OSError) as exc:
         logger.warning("Failed to load %s: %s", path, exc)
         return None
@@ -7,7 +7,6 @@ Signal naming convention: 'category:event'
 import asyncio
 import logging
 import threading
-from collections import defaultdict
 from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
@@ -20,25 +19,30 @@ class SignalBus:
     If called from the event loop thread, listeners run inline.
     If called from another thread, delivery is scheduled via call_soon_threadsafe.
     Exceptions in one listener don't block others.
+
+    Listener lists are copy-on-write tuples: ``on``/``off`` swap in a new
+    tuple under the lock, so ``emit`` reads the current one without locking.
     """
 
     def __init__(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
-        self._listeners: dict[str, list[Callable]] = defaultdict(list)
+        self._listeners: dict[str, tuple[Callable, ...]] = {}
         self._lock = threading.Lock()
 
     def on(self, signal: str, callback: Callable[..., Any]) -> None:
         """Subscribe to a named signal. Callback receives (signal, **data)."""
         with self._lock:
-            self._listeners[signal].append(callback)
+            self._listeners[signal] = (*self._listeners.get(signal, ()), callback)
 
     def off(self, signal: str, callback: Callable) -> None:
         """Unsubscribe a callback from a signal."""
         with self._lock:
+            callbacks = list(self._listeners.get(signal, ()))
             try:
-                self._listeners[signal].remove(callback)
+                callbacks.remove(callback)
             except ValueError:
-                pass
+                return
+            self._listeners[signal] = tuple(callbacks)
 
     def emit(self, signal: str, **data) -> None:
         """Fire a signal to all listeners. Thread-safe.
@@ -46,8 +50,7 @@ class SignalBus:
         If on the event loop thread: calls listeners inline.
         If on another thread: schedules via call_soon_threadsafe.
         """
-        with self._lock:
-            callbacks = list(self._listeners.get(signal, []))
+        callbacks = self._listeners.get(signal, ())
         if not callbacks:
             return
 
@@ -63,7 +66,7 @@ class SignalBus:
         else:
             self._loop.call_soon_threadsafe(self._deliver, signal, callbacks, data)
 
-    def _deliver(self, signal: str, callbacks: list[Callable], data: dict) -> None:
+    def _deliver(self, signal: str, callbacks: tuple[Callable, ...], data: dict) -> None:
         """Call each listener, catching exceptions per-listener."""
         for cb in callbacks:
             try:
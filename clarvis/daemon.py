@@ -142,6 +142,7 @@ class CentralHubDaemon:
 
         self.ctx: AppContext | None = None
         self._staleness_handle: asyncio.TimerHandle | None = None
+        self._staleness_deadline = 0.0  # loop.time() at which status goes stale
         self.scheduler: Scheduler | None = None
         self.timer_service: TimerService | None = None
         self.bus: SignalBus | None = None
@@ -260,19 +261,30 @@ class CentralHubDaemon:
     # --- Staleness timer (signal-driven, replaces polling) ---
 
     def _reset_staleness_timer(self) -> None:
-        """Reset the 30s staleness timer. Called from IPC thread on each hook event."""
+        """Push the 30s staleness deadline out. Called from IPC thread on each hook event.
+
+        Only the deadline moves; a single pending handle re-arms itself for
+        the remainder when it fires early, instead of a cancel + call_later
+        round-trip through the loop on every event.
+        """
         if not self.ctx:
             return
+        loop = self.ctx.loop
+        self._staleness_deadline = loop.time() + STALENESS_TIMEOUT_SECONDS
+        if self._staleness_handle is None:
+            loop.call_soon_threadsafe(self._arm_staleness_timer)
 
-        def _reset():
-            if self._staleness_handle is not None:
-                self._staleness_handle.cancel()
-            self._staleness_handle = self.ctx.loop.call_later(STALENESS_TIMEOUT_SECONDS, self._go_stale)
-
-        self.ctx.loop.call_soon_threadsafe(_reset)
+    def _arm_staleness_timer(self) -> None:
+        if self._staleness_handle is None:
+            self._staleness_handle = self.ctx.loop.call_at(self._staleness_deadline, self._go_stale)
 
     def _go_stale(self) -> None:
         """Fire once after 30s of silence — reset status to idle."""
+        self._staleness_handle = None
+        if self._staleness_deadline > self.ctx.loop.time():
+            # Events arrived since arming -- wait out the rest
+            self._arm_staleness_timer()
+            return
         stale_reset = self.hook_processor.check_status_staleness(STALENESS_TIMEOUT_SECONDS)
         if stale_reset and not self.state.status_locked:
             self.state.update("status", {"status": "idle"})
@@ -655,12 +667,12 @@ class CentralHubDaemon:
         # Kill any in-flight TTS immediately
         if self.voice_orchestrator:
             self.voice_orchestrator._kill_tts()
-        # Shut down all agents — we're inside the event loop, so await directly
-        for agent in self._agents.values():
-            try:
-                await asyncio.wait_for(agent.disconnect(), timeout=5.0)
-            except Exception:
-                pass  # Best-effort — daemon is exiting anyway
+        # Shut down all agents concurrently — we're inside the event loop, so
+        # await directly; best-effort, the daemon is exiting anyway
+        await asyncio.gather(
+            *(asyncio.wait_for(agent.disconnect(), timeout=5.0) for agent in self._agents.values()),
+            return_exceptions=True,
+        )
         # Stop channel manager
         if self.channel_manager:
             try:
@@ -1,14 +1,78 @@
 """macOS system sound playback."""
 
 import asyncio
+import ctypes
+import functools
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SOUNDS_DIR = "/System/Library/Sounds"
+_AUDIO_TOOLBOX = "/System/Library/Frameworks/AudioToolbox.framework/AudioToolbox"
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+
+
+@functools.lru_cache(maxsize=1)
+def _frameworks() -> tuple[ctypes.CDLL, ctypes.CDLL] | None:
+    """Load AudioToolbox + CoreFoundation once; None off macOS."""
+    try:
+        toolbox = ctypes.CDLL(_AUDIO_TOOLBOX)
+        cf = ctypes.CDLL(_CORE_FOUNDATION)
+    except OSError:
+        return None
+    cf.CFURLCreateFromFileSystemRepresentation.restype = ctypes.c_void_p
+    cf.CFURLCreateFromFileSystemRepresentation.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_long,
+        ctypes.c_bool,
+    ]
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    toolbox.AudioServicesCreateSystemSoundID.restype = ctypes.c_int32
+    toolbox.AudioServicesCreateSystemSoundID.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+    toolbox.AudioServicesPlaySystemSound.argtypes = [ctypes.c_uint32]
+    return toolbox, cf
+
+
+@functools.lru_cache(maxsize=16)
+def _system_sound_id(sound: str) -> int | None:
+    """Register *sound* with AudioServices once and cache its SystemSoundID."""
+    frameworks = _frameworks()
+    if frameworks is None:
+        return None
+    toolbox, cf = frameworks
+    path = f"{_SOUNDS_DIR}/{sound}.aiff".encode()
+    url = cf.CFURLCreateFromFileSystemRepresentation(None, path, len(path), False)
+    if not url:
+        return None
+    try:
+        sid = ctypes.c_uint32()
+        status = toolbox.AudioServicesCreateSystemSoundID(url, ctypes.byref(sid))
+    finally:
+        cf.CFRelease(url)
+    if status != 0:
+        logger.debug("AudioServicesCreateSystemSoundID(%s) failed: %d", sound, status)
+        return None
+    return sid.value
 
 
 async def play_system_sound(sound: str = "Glass") -> None:
-    """Play a macOS system sound via ``afplay`` (fire-and-forget safe)."""
+    """Play a macOS system sound (fire-and-forget safe).
+
+    Uses a preregistered AudioServices SystemSoundID, which returns
+    immediately; falls back to spawning ``afplay`` if that is unavailable.
+    """
+    try:
+        sid = _system_sound_id(sound)
+        if sid is not None:
+            _frameworks()[0].AudioServicesPlaySystemSound(sid)
+            return
+    except Exception:
+        logger.debug("AudioServices playback failed for %s", sound, exc_info=True)
     try:
         proc = await asyncio.create_subprocess_exec(
             "afplay",
-            f"/System/Library/Sounds/{sound}.aiff",
+            f"{_SOUNDS_DIR}/{sound}.aiff",
             stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.DEVNULL,
         )
@@ -3,6 +3,7 @@
 Business logic only — scheduling is handled by the Scheduler.
 """
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -60,6 +61,8 @@ class RefreshManager:
         state: "StateStore",
     ):
         self.state = state
+        self._refresh_lock = threading.Lock()
+        self._refresh_done: threading.Event | None = None
 
     def refresh_location(self) -> tuple[float, float, str]:
         """Refresh location data."""
@@ -134,7 +137,28 @@ class RefreshManager:
         return time_dict
 
     def refresh_all(self) -> None:
-        """Refresh all data sources."""
+        """Refresh all data sources.
+
+        Single-flight: a call that arrives while another refresh is running
+        (startup kick, Scheduler tick, IPC) waits for that one instead of
+        issuing a second round of location/weather requests.
+        """
+        with self._refresh_lock:
+            done = self._refresh_done
+            leader = done is None
+            if leader:
+                done = self._refresh_done = threading.Event()
+        if not leader:
+            done.wait()
+            return
+        try:
+            self._refresh_all()
+        finally:
+            with self._refresh_lock:
+                self._refresh_done = None
+            done.set()
+
+    def _refresh_all(self) -> None:
         lat, lon, city = self.refresh_location()
 
         try:
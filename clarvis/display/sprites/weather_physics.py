@@ -23,7 +23,7 @@ except ImportError:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Shape:
     """Multi-character pattern for weather particles."""
 
@@ -45,7 +45,7 @@ class Shape:
         return cls(pattern=pattern, width=width, height=height)
 
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
     """A single particle for ambient clouds (non-JIT path)."""
 
@@ -58,7 +58,7 @@ class Particle:
     lifetime: int = 200
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Rectangle exclusion zone."""
 
@@ -5,6 +5,7 @@ etc.) into semantic statuses, special animation triggers, and staleness
 detection.
 """
 
+import time
 from datetime import datetime
 
 from ..core.state import StateStore
@@ -26,6 +27,9 @@ class HookProcessor:
     ):
         self.state = state
         self.session_tracker = session_tracker
+        # Monotonic time of the last event we stamped, keyed by its ISO timestamp,
+        # so staleness checks on our own statuses skip parsing and wall-clock math
+        self._last_stamp: tuple[str, float] = ("", 0.0)
 
     def process_hook_event(self, raw_data: dict) -> dict:
         """Process raw hook event into a semantic status dict."""
@@ -52,6 +56,8 @@ class HookProcessor:
         self.session_tracker.update(session_id, status, tool_name, tool_succeeded)
 
         session = self.session_tracker.get(session_id)
+        timestamp = datetime.now().isoformat()
+        self._last_stamp = (timestamp, time.monotonic())
 
         return {
             "session_id": session_id,
@@ -59,7 +65,7 @@ class HookProcessor:
             "status_history": session.get("status_history", []),
             "tool_history": session.get("tool_history", []),
             "tool_outcomes": session.get("tool_outcomes", []),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
     def _check_special_animation(self, session_id: str) -> str | None:
@@ -118,9 +124,12 @@ class HookProcessor:
             return False
 
         try:
-            last_update = datetime.fromisoformat(timestamp_str)
-            age = datetime.now() - last_update
-            if age.total_seconds() > timeout_seconds:
+            stamp, stamp_mono = self._last_stamp
+            if timestamp_str == stamp:
+                age = time.monotonic() - stamp_mono
+            else:
+                age = (datetime.now() - datetime.fromisoformat(timestamp_str)).total_seconds()
+            if age > timeout_seconds:
                 stale_status = {
                     **status,
                     "status": "idle",
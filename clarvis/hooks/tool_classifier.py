@@ -1,4 +1,8 @@
 """Tool name → semantic status classification."""
+
+import functools
+import re
+
 # --- Tool classification ---
 
 READING_TOOLS = {"Read", "Grep", "Glob", "WebFetch", "WebSearch", "LS", "NotebookRead"}
@@ -12,8 +16,24 @@ WRITING_KEYWORDS = {"write", "create", "edit", "replace", "insert", "delete", "u
 EXECUTING_KEYWORDS = {"execute", "run", "shell", "browser", "click", "navigate", "type", "press", "play", "pause"}
 
 
+def _keyword_re(keywords: set[str]) -> re.Pattern[str]:
+    """Compile a keyword set into one case-insensitive substring alternation."""
+    return re.compile("|".join(sorted(map(re.escape, keywords))), re.IGNORECASE)
+
+
+# One regex scan per category instead of a substring test per keyword
+_WRITING_RE = _keyword_re(WRITING_KEYWORDS)
+_EXECUTING_RE = _keyword_re(EXECUTING_KEYWORDS)
+_READING_RE = _keyword_re(READING_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=256)
 def classify_tool(tool_name: str) -> str:
-    """Classify a tool into a semantic status based on its name."""
+    """Classify a tool into a semantic status based on its name.
+
+    Memoized: the result depends only on the name, and a session only
+    ever uses a few dozen distinct tools.
+    """
     if tool_name in READING_TOOLS:
         return "reading"
     if tool_name in WRITING_TOOLS:
@@ -26,12 +46,11 @@ def classify_tool(tool_name: str) -> str:
         return "idle"
 
     if tool_name.startswith("mcp__"):
-        lower = tool_name.lower()
-        if any(kw in lower for kw in WRITING_KEYWORDS):
+        if _WRITING_RE.search(tool_name):
             return "writing"
-        if any(kw in lower for kw in EXECUTING_KEYWORDS):
+        if _EXECUTING_RE.search(tool_name):
             return "executing"
-        if any(kw in lower for kw in READING_KEYWORDS):
+        if _READING_RE.search(tool_name):
             return "reading"
 
     return "running"
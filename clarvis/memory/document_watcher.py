@@ -1,30 +1,51 @@
 """Watches a directory for new/changed files and ingests via MemoryStore.
 
 Uses content hashing (SHA256) to skip unchanged files.  Persists hash state
-to a JSON file so restarts don't re-ingest already-processed documents.
+to a JSON snapshot plus an append-only journal of per-scan updates, so
+restarts don't re-ingest already-processed documents and a scan that
+changes one file doesn't rewrite every stored hash.
 Runs as a polling loop on the asyncio event loop.
 """
 
 import asyncio
 import fnmatch
 import hashlib
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
-from clarvis.core.persistence import json_load_safe, json_save_atomic
+from clarvis.core.persistence import _loads, json_load_safe, json_save_atomic
+
+try:
+    import orjson
+
+    def _journal_line(updates: dict[str, str]) -> bytes:
+        return orjson.dumps(updates, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+
+    def _journal_line(updates: dict[str, str]) -> bytes:
+        return (json.dumps(updates) + "\n").encode()
+
 
 logger = logging.getLogger(__name__)
 
 # Files we never try to ingest.
 _SKIP_PATTERNS = {".*", "__pycache__", "*.pyc", ".DS_Store"}
 
+# Fold the journal back into the snapshot after this many appended records.
+_JOURNAL_COMPACT_EVERY = 64
 
-def _should_skip(rel: Path) -> bool:
-    """Return True if *rel* (relative to watch root) should be skipped."""
-    if any(part.startswith(".") for part in rel.parts):
+
+def _should_skip(name: str) -> bool:
+    """Return True if a file or directory called *name* should be skipped.
+
+    A hidden directory hides everything below it, so the walk prunes it.
+    """
+    if name.startswith("."):
         return True
-    return any(fnmatch.fnmatch(rel.name, pat) for pat in _SKIP_PATTERNS)
+    return any(fnmatch.fnmatch(name, pat) for pat in _SKIP_PATTERNS)
 
 
 class DocumentWatcher:
@@ -52,8 +73,12 @@ class DocumentWatcher:
         self._watch_dir = Path(watch_dir).expanduser()
         self._backend = memory
         self._hash_store_path = Path(hash_store_path).expanduser()
+        self._journal_path = self._hash_store_path.with_suffix(".journal")
+        self._journal_records = 0
         self._poll_interval = poll_interval
         self._hashes: dict[str, str] = self._load_hashes()
+        # (mtime_ns, size) of files whose stored hash is current; not persisted
+        self._stats: dict[str, tuple[int, int] | None] = {}
         self._task: asyncio.Task | None = None
 
     # ── Lifecycle ───────────────────────────────────────────────
@@ -78,13 +103,45 @@ class DocumentWatcher:
     # ── Hash persistence ────────────────────────────────────────
 
     def _load_hashes(self) -> dict[str, str]:
+        """Load the snapshot, replay the journal over it, then compact."""
         data = json_load_safe(self._hash_store_path)
-        if isinstance(data, dict):
-            return data
-        return {}
+        hashes = data if isinstance(data, dict) else {}
+        try:
+            lines = self._journal_path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return hashes
+        except OSError:
+            logger.warning("Failed to read %s", self._journal_path, exc_info=True)
+            return hashes
+        for line in lines:
+            try:
+                record = _loads(line)
+            except ValueError:
+                continue  # torn final write
+            if isinstance(record, dict):
+                hashes.update(record)
+        self._compact(hashes)
+        return hashes
+
+    def _save_hashes(self, updates: dict[str, str]) -> None:
+        """Append *updates* to the journal, compacting once it grows long."""
+        try:
+            self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._journal_path, "ab") as f:
+                f.write(_journal_line(updates))
+        except OSError:
+            logger.warning("Failed to append %s", self._journal_path, exc_info=True)
+            self._compact(self._hashes)
+            return
+        self._journal_records += 1
+        if self._journal_records >= _JOURNAL_COMPACT_EVERY:
+            self._compact(self._hashes)
 
-    def _save_hashes(self) -> None:
-        json_save_atomic(self._hash_store_path, self._hashes)
+    def _compact(self, hashes: dict[str, str]) -> None:
+        """Write *hashes* as the snapshot and drop the journal."""
+        if json_save_atomic(self._hash_store_path, hashes):
+            self._journal_path.unlink(missing_ok=True)
+            self._journal_records = 0
 
     # ── Content hashing ─────────────────────────────────────────
 
@@ -99,6 +156,36 @@ class DocumentWatcher:
 
     # ── Scanning ────────────────────────────────────────────────
 
+    def _list_files(self) -> list[tuple[Path, tuple[int, int] | None]]:
+        """Return sorted ``(path, (mtime_ns, size))`` for ingestible files.
+
+        Walks with ``os.scandir`` so directory/file checks come from the
+        dirent type instead of a ``stat`` per path, and never descends into
+        hidden directories, whose contents would all be skipped anyway.
+        """
+        found: list[tuple[str, tuple[int, int] | None]] = []
+        stack = [os.fspath(self._watch_dir)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and not _should_skip(entry.name):
+                        try:
+                            st = entry.stat()
+                            sig = (st.st_mtime_ns, st.st_size)
+                        except OSError:
+                            sig = None
+                        found.append((entry.path, sig))
+        found.sort()
+        return [(Path(path), sig) for path, sig in found]
+
     async def scan(self) -> list[dict[str, Any]]:
         """Scan the watch directory and ingest changed files.
 
@@ -108,40 +195,56 @@ class DocumentWatcher:
         if not self._watch_dir.is_dir():
             return []
 
-        loop = asyncio.get_running_loop()
-        results: list[dict[str, Any]] = []
-
-        for path in sorted(self._watch_dir.rglob("*")):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(self._watch_dir)
-            if _should_skip(rel):
+        # Walk off the event loop; only re-hash files whose mtime/size moved
+        # since we last saw them hash-clean, and hash those concurrently
+        listed = await asyncio.to_thread(self._list_files)
+        candidates: list[tuple[Path, str, tuple[int, int] | None]] = []
+        for path, sig in listed:
+            rel = str(path.relative_to(self._watch_dir))
+            if sig is not None and self._stats.get(rel) == sig and rel in self._hashes:
                 continue
+            candidates.append((path, rel, sig))
+        hashes = await asyncio.gather(
+            *(asyncio.to_thread(self._hash_file, path) for path, _, _ in candidates),
+            return_exceptions=True,
+        )
 
-            rel = str(rel)
-            try:
-                current_hash = await loop.run_in_executor(None, self._hash_file, path)
-            except OSError:
-                logger.warning("Failed to hash %s", path, exc_info=True)
+        changed: list[tuple[Path, str, str, tuple[int, int] | None]] = []
+        for (path, rel, sig), current_hash in zip(candidates, hashes):
+            if isinstance(current_hash, BaseException):
+                logger.warning("Failed to hash %s", path, exc_info=current_hash)
                 continue
 
             stored_hash = self._hashes.get(rel)
             if stored_hash == current_hash:
+                self._stats[rel] = sig  # touched but identical
                 continue  # unchanged
 
             logger.info("Document changed: %s", rel)
-            try:
-                result = await self._backend.kg_ingest(
-                    str(path),
-                    dataset="documents",
-                    tags=[rel],
-                )
-                result["file"] = rel
-                results.append(result)
-                self._hashes[rel] = current_hash
-                self._save_hashes()
-            except Exception:
-                logger.exception("Failed to ingest %s", rel)
+            changed.append((path, rel, current_hash, sig))
+
+        if not changed:
+            return []
+
+        # Submitted together so the backend can batch them into one pass
+        outcomes = await asyncio.gather(
+            *(self._backend.kg_ingest(str(path), dataset="documents", tags=[rel]) for path, rel, _, _ in changed),
+            return_exceptions=True,
+        )
+
+        results: list[dict[str, Any]] = []
+        updates: dict[str, str] = {}
+        for (_, rel, current_hash, sig), result in zip(changed, outcomes):
+            if isinstance(result, BaseException):
+                logger.error("Failed to ingest %s", rel, exc_info=result)
+                continue
+            result["file"] = rel
+            results.append(result)
+            updates[rel] = current_hash
+            self._stats[rel] = sig
+        if updates:
+            self._hashes.update(updates)
+            self._save_hashes(updates)
 
         return results
 
@@ -107,3 +107,6 @@ ENTITY_TYPES: dict[str, type[DataPoint]] = {
     "Genre": Genre,
     "Document": Document,
 }
+
+# ``graph_model`` argument for ``cognee.cognify`` -- built once at import.
+GRAPH_MODEL: list[type[DataPoint]] = list(ENTITY_TYPES.values())
@@ -15,9 +15,12 @@ Falls back to mental-models-only if no grounding files exist (pre-first-checkin)
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 from clarvis.core.paths import agent_home
 
 if TYPE_CHECKING:
@@ -29,6 +32,10 @@ logger = logging.getLogger(__name__)
 _CHARS_PER_TOKEN = 4
 _DEFAULT_TOKEN_BUDGET = 4096
 
+# grounding dir -> (per-file (name, mtime_ns, size) signature, composed text);
+# normally one dir per agent home, bounded so stray dirs cannot pile up
+_grounding_cache: LRUCache = LRUCache(maxsize=8)
+
 
 async def build_memory_context(
     store: "MemoryStore",
@@ -108,21 +115,40 @@ def _read_grounding_files(grounding_dir: Path) -> str:
     """Read all ``*.md`` files from grounding directory, sorted by name.
 
     Returns concatenated content, or empty string if directory doesn't exist
-    or contains no markdown files.
+    or contains no markdown files.  The composed text is cached against
+    each file's mtime and size, so a reset with unchanged files only stats.
     """
-    if not grounding_dir.is_dir():
+    key = os.fspath(grounding_dir)
+    try:
+        with os.scandir(key) as it:
+            entries = sorted((e for e in it if e.name.endswith(".md")), key=lambda e: e.name)
+    except OSError:
         return ""
+    stats: list[tuple[str, int, int]] = []
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        stats.append((entry.name, st.st_mtime_ns, st.st_size))
+    signature = tuple(stats)
+
+    cached = _grounding_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     parts: list[str] = []
-    for md_file in sorted(grounding_dir.glob("*.md")):
+    for entry in entries:
         try:
-            content = md_file.read_text(encoding="utf-8").strip()
+            content = Path(entry.path).read_text(encoding="utf-8").strip()
             if content:
                 parts.append(content)
         except Exception:
-            logger.debug("Failed to read grounding file %s", md_file, exc_info=True)
+            logger.debug("Failed to read grounding file %s", entry.path, exc_info=True)
 
-    return "\n\n".join(parts)
+    text = "\n\n".join(parts)
+    _grounding_cache[key] = (signature, text)
+    return text
 
 
 async def _build_bank_section(
@@ -1,45 +1,144 @@
 """Parse Pi session JSONL files into structured messages."""
 
+import functools
 import json
 import logging
+import mmap
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
-def parse_session(path: Path) -> list[dict[str, str]]:
+def _parse_line(line: bytes) -> Any:
+    """Decode one JSONL line, or return None if it isn't valid JSON."""
+    try:
+        return _loads(line)
+    except ValueError:
+        pass
+    # Non-UTF-8 bytes: retry with replacement chars, as read_text(errors="replace") did
+    try:
+        return json.loads(line.decode("utf-8", errors="replace"))
+    except ValueError:
+        return None
+
+
+def _tail_lines(path: Path) -> Iterator[bytes]:
+    """Yield the lines of *path* last-to-first, scanning a memory map backwards."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while True:
+                nl = mm.rfind(b"\n", 0, end)
+                yield mm[nl + 1 : end]
+                if nl < 0:
+                    return
+                end = nl
+
+
+def _message_from_line(line: bytes) -> dict[str, str] | None:
+    """Parse one JSONL line into a message, or None if it isn't one.
+
+    Lines that can't be a user/assistant message (no ``"message"`` or role
+    token anywhere in the raw bytes) are rejected before JSON decoding, so
+    tool results, session metadata and model changes are never materialized.
+    """
+    if b'"message"' not in line or (b'"user"' not in line and b'"assistant"' not in line):
+        return None
+    return _message_from_entry(_parse_line(line))
+
+
+def _message_from_entry(entry: Any) -> dict[str, str] | None:
+    """Return {"role", "text"} for a user/assistant text message entry."""
+    if not isinstance(entry, dict) or entry.get("type") != "message":
+        return None
+    msg = entry.get("message", {})
+    role = msg.get("role")
+    if role not in ("user", "assistant"):
+        return None
+    # Extract text from content blocks
+    content = msg.get("content", [])
+    text_parts = []
+    for block in content:
+        if isinstance(block, dict) and block.get("type") == "text":
+            text_parts.append(block.get("text", ""))
+        elif isinstance(block, str):
+            text_parts.append(block)
+    if not text_parts:
+        return None
+    return {"role": role, "text": "\n".join(text_parts)}
+
+
+def parse_session(path: Path, limit: int | None = None) -> list[dict[str, str]]:
     """Parse a Pi session JSONL file, return [{"role": ..., "text": ...}].
 
     Extracts user and assistant text messages, skipping metadata entries
-    (session, model_change, system prompts, etc.).
+    (session, model_change, system prompts, etc.).  With *limit*, only the
+    last *limit* messages are returned and the file is read from the end,
+    stopping as soon as enough have been found.
+
+    Tail results are cached by the file's mtime and size, so re-reading
+    an unchanged session skips the parse; full parses are unbounded in
+    size and are not cached.
     """
     try:
-        raw = path.read_text(encoding="utf-8", errors="replace")
+        if limit is None:
+            return _parse_full(path)
+        st = os.stat(path)
+        messages = _parse_tail_cached(os.fspath(path), st.st_mtime_ns, st.st_size, limit)
     except FileNotFoundError:
         return []
+    return [dict(m) for m in messages]
+
+
+def parse_sessions(paths: Sequence[Path], limit: int | None = None) -> list[list[dict[str, str]]]:
+    """Parse several session files, in order, reading them concurrently."""
+    if len(paths) <= 1:
+        return [parse_session(path, limit) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(pool.map(lambda path: parse_session(path, limit), paths))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_tail_cached(path: str, mtime_ns: int, size: int, limit: int) -> tuple[dict[str, str], ...]:
+    # mtime_ns/size only key the cache -- any write to the file misses it
+    return tuple(_parse_tail(Path(path), limit))
+
+
+def _parse_full(path: Path) -> list[dict[str, str]]:
     messages = []
-    for line in raw.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if entry.get("type") != "message":
-            continue
-        msg = entry.get("message", {})
-        role = msg.get("role")
-        if role not in ("user", "assistant"):
+    # Stream line by line rather than holding the whole file plus a split copy
+    with open(path, "rb") as f:
+        for line in f:
+            message = _message_from_line(line)
+            if message is not None:
+                messages.append(message)
+    return messages
+
+
+def _parse_tail(path: Path, limit: int) -> list[dict[str, str]]:
+    messages: list[dict[str, str]] = []
+    if limit <= 0:
+        return messages
+    for line in _tail_lines(path):
+        message = _message_from_line(line)
+        if message is None:
             continue
-        # Extract text from content blocks
-        content = msg.get("content", [])
-        text_parts = []
-        for block in content:
-            if isinstance(block, dict) and block.get("type") == "text":
-                text_parts.append(block.get("text", ""))
-            elif isinstance(block, str):
-                text_parts.append(block)
-        if text_parts:
-            messages.append({"role": role, "text": "\n".join(text_parts)})
+        messages.append(message)
+        if len(messages) >= limit:
+            break
+    messages.reverse()
     return messages
@@ -4,6 +4,7 @@ Single class managing both engines with independent failure tolerance.
 Hindsight methods keep their original names; Cognee methods are prefixed with ``kg_``.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -12,8 +13,26 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from cachetools import LRUCache, TTLCache
+
+try:
+    import orjson
+
+    def _dumps_result(content: Any) -> str:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+
+    def _dumps_result(content: Any) -> str:
+        return json.dumps(content, default=str, ensure_ascii=False)
+
+
 logger = logging.getLogger(__name__)
 
+# kg_ingest calls landing within this window are sent to cognee as one batch
+_KG_INGEST_BATCH_WINDOW = 0.05
+_KG_INGEST_BATCH_MAX = 64
+# How long stop() lets queued ingests finish before cancelling them
+_KG_INGEST_STOP_TIMEOUT = 30.0
 
 # ── Local dataclasses (not in upstream hindsight_api 0.4.15) ───────────
 
@@ -46,6 +65,21 @@ class ConsolidationDecision:
 
 # ── Cognee formatting helpers ──────────────────────────────────────────
 
+# Formatted listings stop adding lines past this many characters
+_FMT_MAX_CHARS = 16_000
+# Collapse line breaks/tabs so each preview stays on its entry's line
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
+def _join_capped(lines: list[str]) -> str:
+    """Join *lines* with newlines, truncating the listing at ``_FMT_MAX_CHARS``."""
+    total = 0
+    for i, line in enumerate(lines):
+        total += len(line) + 1
+        if total > _FMT_MAX_CHARS and i:
+            return "\n".join([*lines[:i], f"  ... {len(lines) - i} more"])
+    return "\n".join(lines)
+
 
 def _fmt_entities(entities: list[dict]) -> str:
     if not entities:
@@ -58,11 +92,11 @@ def _fmt_entities(entities: list[dict]) -> str:
         desc = e.get("description") or ""
         parts = [f"[{etype}]" if etype else "", name]
         if desc:
-            preview = desc[:60] + ("..." if len(desc) > 60 else "")
+            preview = desc[:60].translate(_WS_TABLE) + ("..." if len(desc) > 60 else "")
             parts.append(f"-- {preview}")
         line = " ".join(p for p in parts if p)
         lines.append(f"  {i}. [id:{eid}] {line}")
-    return "\n".join(lines)
+    return _join_capped(lines)
 
 
 def _fmt_relations(rels: list[dict]) -> str:
@@ -76,7 +110,7 @@ def _fmt_relations(rels: list[dict]) -> str:
         props = r.get("properties", {})
         prop_str = f" {props}" if props else ""
         lines.append(f"  {i}. [{src}] --{rel}--> [{tgt}]{prop_str}")
-    return "\n".join(lines)
+    return _join_capped(lines)
 
 
 def _fmt_search_results(results: list[dict]) -> str:
@@ -87,7 +121,7 @@ def _fmt_search_results(results: list[dict]) -> str:
         content = r.get("result", str(r))
         ds_name = r.get("dataset_name", "")
         if isinstance(content, dict):
-            content = json.dumps(content, default=str, ensure_ascii=False)
+            content = _dumps_result(content)
         elif isinstance(content, list):
             content = "; ".join(str(x) for x in content)
         suffix = f" [{ds_name}]" if ds_name else ""
@@ -154,6 +188,16 @@ class MemoryStore:
         self._kg_llm_model = kg_llm_model
         self._kg_llm_api_key = kg_llm_api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         self._kg_ready = False
+        # kg_search results, keyed by query args; cleared on every graph write
+        self._kg_search_cache: LRUCache = LRUCache(maxsize=256)
+        self._kg_generation = 0
+        # Single-entry snapshot of get_graph_data() shared by the list methods
+        self._kg_graph_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+        # In-flight kg_search tasks -- concurrent identical queries share one call
+        self._kg_search_inflight: dict[tuple, asyncio.Task] = {}
+        # Pending kg_ingest items per dataset, drained by one flush task each
+        self._kg_ingest_pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._kg_ingest_flushers: dict[str, asyncio.Task] = {}
 
     # ── Lifecycle ──────────────────────────────────────────────────
 
@@ -227,11 +271,20 @@ class MemoryStore:
             self._kg_ready = False
 
     async def stop(self) -> None:
+        # Drain queued ingests while the store still reports ready; cognify
+        # passes are LLM-bound, so give up (cancelling waiters) after a bound
+        if self._kg_ingest_flushers:
+            flushers = asyncio.gather(*self._kg_ingest_flushers.values(), return_exceptions=True)
+            try:
+                await asyncio.wait_for(flushers, timeout=_KG_INGEST_STOP_TIMEOUT)
+            except TimeoutError:
+                logger.warning("kg_ingest still running after %.0fs, cancelled", _KG_INGEST_STOP_TIMEOUT)
         if self._engine is not None:
             await self._engine.close()
             self._engine = None
         self._facts_ready = False
         self._kg_ready = False
+        self._kg_invalidate()
         logger.info("MemoryStore stopped")
 
     @property
@@ -252,6 +305,13 @@ class MemoryStore:
         if bank not in self._banks:
             raise ValueError(f"Unknown bank '{bank}'. Available: {', '.join(self._banks)}")
 
+    def _kg_invalidate(self) -> None:
+        """Drop cached knowledge-graph reads after a write."""
+        self._kg_generation += 1
+        self._kg_search_cache.clear()
+        self._kg_search_inflight.clear()
+        self._kg_graph_cache.clear()
+
     def _rc(self):
         from hindsight_api.models import RequestContext
 
@@ -822,12 +882,24 @@ class MemoryStore:
                     obs_objects.append(obs)
                     valid_obs_ids.add(str(obs.id))
 
+        # Fact ids recur across decisions and the mark list -- parse each once
+        parsed_ids: dict[str, uuid_module.UUID] = {}
+
+        def _as_uuids(fact_ids: list[str]) -> list[uuid_module.UUID]:
+            uuids = []
+            for fid in fact_ids:
+                fact_uuid = parsed_ids.get(fid)
+                if fact_uuid is None:
+                    fact_uuid = parsed_ids[fid] = uuid_module.UUID(fid)
+                uuids.append(fact_uuid)
+            return uuids
+
         created = updated = deleted = skipped = 0
 
         async with acquire_with_retry(pool) as conn:
             for d in decisions:
                 if d.action == "create":
-                    source_uuids = [uuid_module.UUID(fid) for fid in d.source_fact_ids]
+                    source_uuids = _as_uuids(d.source_fact_ids)
                     await _execute_create_action(
                         conn=conn,
                         memory_engine=self._engine,
@@ -847,7 +919,7 @@ class MemoryStore:
                         )
                         skipped += 1
                         continue
-                    source_uuids = [uuid_module.UUID(fid) for fid in d.source_fact_ids]
+                    source_uuids = _as_uuids(d.source_fact_ids)
                     await _execute_update_action(
                         conn=conn,
                         memory_engine=self._engine,
@@ -872,14 +944,14 @@ class MemoryStore:
                     await _execute_delete_action(conn=conn, bank_id=bank, observation_id=d.observation_id)
                     deleted += 1
 
-            # Mark facts as consolidated
-            marked = 0
-            for fact_id in fact_ids_to_mark:
+            # Mark facts as consolidated -- one statement for the whole list
+            mark_uuids = _as_uuids(fact_ids_to_mark)
+            if mark_uuids:
                 await conn.execute(
-                    f"UPDATE {fq_table('memory_units')} SET consolidated_at = NOW() WHERE id = $1",
-                    uuid_module.UUID(fact_id),
+                    f"UPDATE {fq_table('memory_units')} SET consolidated_at = NOW() WHERE id = ANY($1::uuid[])",
+                    mark_uuids,
                 )
-                marked += 1
+            marked = len(mark_uuids)
 
         return {"created": created, "updated": updated, "deleted": deleted, "skipped": skipped, "marked": marked}
 
@@ -1258,16 +1330,16 @@ class MemoryStore:
         tags: list[str] | None = None,
         format: bool = False,
     ) -> dict[str, Any] | str:
-        """Ingest content or file path through the cognee pipeline."""
-        import cognee
+        """Ingest content or file path through the cognee pipeline.
 
-        from .entity_types import ENTITY_TYPES
-
-        await cognee.add(content_or_path, dataset_name=dataset)
-        await cognee.cognify(
-            datasets=[dataset],
-            graph_model=list(ENTITY_TYPES.values()),
-        )
+        Calls arriving within a short window are queued per dataset and
+        sent as one ``cognee.add`` + ``cognify`` pass.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._kg_ingest_pending.setdefault(dataset, []).append((content_or_path, future))
+        if dataset not in self._kg_ingest_flushers:
+            self._kg_ingest_flushers[dataset] = asyncio.create_task(self._kg_ingest_flush(dataset))
+        await future
 
         result = {"status": "ok", "dataset": dataset, "tags": tags or []}
         if format:
@@ -1275,6 +1347,64 @@ class MemoryStore:
             return f"Ingested into '{dataset}' (status: ok{tag_info})"
         return result
 
+    async def _kg_cognify(self, data: str | list[str], dataset: str) -> None:
+        """Run one ``cognee.add`` + ``cognify`` pass over *data*."""
+        import cognee
+
+        from .entity_types import GRAPH_MODEL
+
+        try:
+            await cognee.add(data, dataset_name=dataset)
+            await cognee.cognify(
+                datasets=[dataset],
+                graph_model=GRAPH_MODEL,
+            )
+        finally:
+            self._kg_invalidate()
+
+    async def _kg_ingest_flush(self, dataset: str) -> None:
+        """Drain queued kg_ingest items for *dataset* in batches.
+
+        If a multi-item batch fails, its items are retried one by one so a
+        single bad document only fails its own caller.
+        """
+        batch: list[tuple[str, asyncio.Future]] = []
+        try:
+            await asyncio.sleep(_KG_INGEST_BATCH_WINDOW)
+            while pending := self._kg_ingest_pending.get(dataset):
+                batch = pending[:_KG_INGEST_BATCH_MAX]
+                del pending[:_KG_INGEST_BATCH_MAX]
+                if len(batch) > 1:
+                    try:
+                        await self._kg_cognify([item for item, _ in batch], dataset)
+                    except Exception:
+                        # cognee.add may have stored part of the batch before the
+                        # failure; the per-item retry re-adds those items too and
+                        # relies on cognee deduplicating data by content hash.
+                        logger.warning("Batched kg_ingest of %d items failed, retrying singly", len(batch))
+                    else:
+                        for _, future in batch:
+                            if not future.done():
+                                future.set_result(None)
+                        continue
+                for item, future in batch:
+                    try:
+                        await self._kg_cognify(item, dataset)
+                    except Exception as exc:
+                        if not future.done():
+                            future.set_exception(exc)
+                    else:
+                        if not future.done():
+                            future.set_result(None)
+        except asyncio.CancelledError:
+            # Never leave a caller waiting on an item this task will not flush
+            for _, future in [*batch, *self._kg_ingest_pending.get(dataset, ())]:
+                future.cancel()
+            raise
+        finally:
+            self._kg_ingest_pending.pop(dataset, None)
+            del self._kg_ingest_flushers[dataset]
+
     async def kg_search(
         self,
         query: str,
@@ -1284,7 +1414,58 @@ class MemoryStore:
         top_k: int = 10,
         format: bool = False,
     ) -> list[dict[str, Any]] | str:
-        """Search the knowledge graph."""
+        """Search the knowledge graph.
+
+        Results are cached per (query, search_type, top_k, datasets) until
+        the next graph write, and concurrent identical searches share a
+        single cognee call.
+        """
+        key = (query, search_type, top_k, tuple(sorted(datasets or ())))
+        items = self._kg_search_cache.get(key)
+        if items is None:
+            task = self._kg_search_inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._kg_search_uncached(query, search_type, datasets, top_k))
+                task.add_done_callback(self._kg_search_done_callback(key, self._kg_generation))
+                self._kg_search_inflight[key] = task
+            # Shield so one cancelled caller doesn't cancel the shared search
+            items = await asyncio.shield(task)
+        items = [dict(item) for item in items]
+        return _fmt_search_results(items) if format else items
+
+    async def _kg_graph_data(self) -> tuple[list, list]:
+        """Return ``(nodes, edges)`` for the whole graph, cached for a short TTL."""
+        data = self._kg_graph_cache.get("graph")
+        if data is None:
+            from cognee.infrastructure.databases.graph import get_graph_engine
+
+            generation = self._kg_generation
+            engine = await get_graph_engine()
+            data = await engine.get_graph_data()
+            if generation == self._kg_generation:
+                self._kg_graph_cache["graph"] = data
+        return data
+
+    def _kg_search_done_callback(self, key: tuple, generation: int):
+        """Build the done-callback that retires an in-flight search and caches it."""
+
+        def _done(task: asyncio.Task) -> None:
+            if self._kg_search_inflight.get(key) is task:
+                del self._kg_search_inflight[key]
+            if task.cancelled() or task.exception() is not None:
+                return
+            if generation == self._kg_generation:  # no write landed mid-search
+                self._kg_search_cache[key] = task.result()
+
+        return _done
+
+    async def _kg_search_uncached(
+        self,
+        query: str,
+        search_type: str,
+        datasets: list[str] | None,
+        top_k: int,
+    ) -> list[dict[str, Any]]:
         import cognee
         from cognee.api.v1.search import SearchType
 
@@ -1299,7 +1480,7 @@ class MemoryStore:
 
         results = await cognee.search(**kwargs)
 
-        items = [
+        return [
             {
                 "result": r.search_result,
                 "dataset_id": str(r.dataset_id) if r.dataset_id else None,
@@ -1307,7 +1488,6 @@ class MemoryStore:
             }
             for r in results
         ]
-        return _fmt_search_results(items) if format else items
 
     async def kg_list_entities(
         self,
@@ -1317,11 +1497,7 @@ class MemoryStore:
         format: bool = False,
     ) -> list[dict[str, Any]] | str:
         """List entities from the knowledge graph."""
-        from cognee.infrastructure.databases.graph import get_graph_engine
-
-        engine = await get_graph_engine()
-        nodes_and_edges = await engine.get_graph_data()
-        nodes = nodes_and_edges[0]
+        nodes, _ = await self._kg_graph_data()
 
         results: list[dict[str, Any]] = []
         for node_id, props in nodes:
@@ -1345,14 +1521,13 @@ class MemoryStore:
         format: bool = False,
     ) -> list[dict[str, Any]] | str:
         """List relationships from the knowledge graph."""
-        from cognee.infrastructure.databases.graph import get_graph_engine
-
-        engine = await get_graph_engine()
-
         if entity_id:
+            from cognee.infrastructure.databases.graph import get_graph_engine
+
+            engine = await get_graph_engine()
             edges = await engine.get_edges(entity_id)
         else:
-            _, edges = await engine.get_graph_data()
+            _, edges = await self._kg_graph_data()
 
         results: list[dict[str, Any]] = []
         for edge in edges:
@@ -1401,6 +1576,7 @@ class MemoryStore:
         finally:
             for source_id, target_id, rel_name, props in edges:
                 await engine.add_edge(str(source_id), str(target_id), rel_name, props)
+            self._kg_invalidate()
 
         result = {"status": "ok", "entity_id": entity_id, "updated_fields": list(fields.keys())}
         if format:
@@ -1422,16 +1598,26 @@ class MemoryStore:
 
         engine = await get_graph_engine()
         survivor_id = entity_ids[0]
+        dup_ids = entity_ids[1:]
+        dup_set = set(dup_ids)
 
-        for dup_id in entity_ids[1:]:
-            edges = await engine.get_edges(dup_id)
-            for source_id, target_id, rel_name, props in edges:
-                new_source = survivor_id if str(source_id) == str(dup_id) else str(source_id)
-                new_target = survivor_id if str(target_id) == str(dup_id) else str(target_id)
-                if new_source == new_target:
-                    continue
-                await engine.add_edge(new_source, new_target, rel_name, props)
-            await engine.delete_node(dup_id)
+        # Edge reads are independent per duplicate -- fetch them concurrently.
+        # Any endpoint in the duplicate set is re-pointed to the survivor, so
+        # edges between two duplicates collapse into self-loops and are skipped.
+        all_edges = await asyncio.gather(*(engine.get_edges(dup_id) for dup_id in dup_ids))
+
+        try:
+            for dup_id, edges in zip(dup_ids, all_edges):
+                for source_id, target_id, rel_name, props in edges:
+                    source, target = str(source_id), str(target_id)
+                    new_source = survivor_id if source in dup_set else source
+                    new_target = survivor_id if target in dup_set else target
+                    if new_source == new_target:
+                        continue
+                    await engine.add_edge(new_source, new_target, rel_name, props)
+                await engine.delete_node(dup_id)
+        finally:
+            self._kg_invalidate()
 
         result = {"status": "ok", "survivor_id": survivor_id, "merged_count": len(entity_ids) - 1}
         if format:
@@ -1443,7 +1629,10 @@ class MemoryStore:
         from cognee.infrastructure.databases.graph import get_graph_engine
 
         engine = await get_graph_engine()
-        await engine.delete_node(node_id)
+        try:
+            await engine.delete_node(node_id)
+        finally:
+            self._kg_invalidate()
         result = {"status": "ok", "deleted_id": node_id}
         return f"Deleted: {node_id[:12]}" if format else result
 
@@ -1451,6 +1640,9 @@ class MemoryStore:
         """Trigger community detection and summary building."""
         import cognee
 
-        await cognee.memify()
+        try:
+            await cognee.memify()
+        finally:
+            self._kg_invalidate()
         result = {"status": "ok", "action": "community_summaries_built"}
         return "Community summaries built (status: ok)" if format else result
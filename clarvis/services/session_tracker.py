@@ -15,7 +15,7 @@ def _default_session() -> dict:
         "tool_outcomes": [],
         "last_status": "idle",
         "last_tool": "",
-        "last_seen": time.time(),
+        "last_seen": time.monotonic(),
     }
 
 
@@ -57,7 +57,7 @@ class SessionTracker:
         sessions = self.state.get("sessions")
         session = sessions.get(session_id) or _default_session()
 
-        session["last_seen"] = time.time()
+        session["last_seen"] = time.monotonic()
 
         # Set displayed session if none set
         if self.displayed_id is None:
@@ -84,10 +84,16 @@ class SessionTracker:
         self.state.update("sessions", sessions)
 
     def cleanup_stale(self) -> None:
-        """Remove sessions inactive for > TIMEOUT."""
-        now = time.time()
+        """Remove sessions inactive for > TIMEOUT.
+
+        Runs on every hook event, so the common nothing-expired case is a
+        single float compare per session with no dict rebuild.
+        """
+        cutoff = time.monotonic() - self.TIMEOUT
         sessions = self.state.peek("sessions")
-        active = {sid: data for sid, data in sessions.items() if now - data.get("last_seen", 0) < self.TIMEOUT}
+        if all(data.get("last_seen", 0) > cutoff for data in sessions.values()):
+            return
+        active = {sid: data for sid, data in sessions.items() if data.get("last_seen", 0) > cutoff}
         if len(active) != len(sessions):
             self.state.update("sessions", active)
             if self.displayed_id not in active:
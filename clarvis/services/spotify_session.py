@@ -53,5 +53,5 @@ def get_playback_state():
         return None
     try:
         return session._executor.player.state
-    except (AttributeError, Exception):
+    except Exception:
         return None
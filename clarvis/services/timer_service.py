@@ -1,11 +1,13 @@
 """Named timer service with persistence and recurring support."""
 
 import asyncio
+import concurrent.futures
 import logging
 import re
 import threading
 import time
-from dataclasses import asdict, dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,6 +23,15 @@ from ..core.persistence import json_load_safe, json_save_atomic
 
 logger = logging.getLogger(__name__)
 
+# Coalescing window for timer state writes
+_PERSIST_DELAY = 0.2
+
+# Common voice forms ("45", "90s", "5m", "1.5h") resolved without pytimeparse.
+# Digit runs are capped so oversized values still go through (and are
+# rejected by) pytimeparse exactly as before.
+_SIMPLE_DURATION_RE = re.compile(r"^(\d{1,9}(?:\.\d{1,6})?)\s*([smh]?)$", re.IGNORECASE)
+_UNIT_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
 
 def parse_duration(s: str) -> float:
     """Parse a human-readable duration string into seconds.
@@ -40,6 +51,13 @@ def parse_duration(s: str) -> float:
     if not s:
         raise ValueError(f"Invalid duration: {s!r}")
 
+    m = _SIMPLE_DURATION_RE.match(s)
+    if m:
+        result = float(m.group(1)) * _UNIT_SECONDS[m.group(2).lower()]
+        if result <= 0:
+            raise ValueError(f"Invalid duration: {s!r}")
+        return result
+
     result = pytimeparse.parse(s)
     if result is None or result <= 0:
         raise ValueError(f"Invalid duration: {s!r}")
@@ -119,7 +137,12 @@ def parse_time(s: str) -> float:
 
 @dataclass
 class Timer:
-    """A named timer."""
+    """A named timer.
+
+    ``fire_at`` and ``created_at`` are wall-clock times for display and
+    persistence; ``deadline`` is the ``time.monotonic()`` instant used for
+    scheduling math, so wall-clock jumps don't skew remaining times.
+    """
 
     name: str
     duration: float
@@ -128,6 +151,7 @@ class Timer:
     created_at: float
     label: str
     wake_clarvis: bool
+    deadline: float = field(default=0.0, repr=False)
 
 
 class TimerService:
@@ -136,6 +160,11 @@ class TimerService:
     Timers are scheduled on the daemon's asyncio event loop via
     ``loop.call_later`` and persisted to ``~/.clarvis/timers.json``
     so they survive restarts.
+
+    ``_timers`` and ``_handles`` are owned by the event loop thread and
+    only mutated there, so no lock is needed.  Entry points that may be
+    called from IPC threads (``set_timer``, ``cancel``) marshal their
+    mutation onto the loop and wait for it.
     """
 
     def __init__(
@@ -148,8 +177,13 @@ class TimerService:
         self._state_file = state_file if state_file else CLARVIS_HOME / "timers.json"
         self._timers: dict[str, Timer] = {}
         self._handles: dict[str, asyncio.TimerHandle] = {}
-        self._lock = threading.Lock()
         self._dirty = False
+        self._persist_handle: asyncio.TimerHandle | None = None
+        self._write_future: asyncio.Future | None = None
+        # Snapshots are numbered so a slow executor write can't clobber a newer one
+        self._write_seq = 0
+        self._written_seq = 0
+        self._write_lock = threading.Lock()
 
     def set_timer(
         self,
@@ -162,8 +196,8 @@ class TimerService:
     ) -> Timer:
         """Create or replace a named timer.
 
-        May be called from any thread. The underlying ``loop.call_later``
-        is scheduled via ``call_soon_threadsafe``.
+        May be called from any thread; off-loop callers block until the
+        event loop has applied the change.
 
         If *at* is provided (seconds-until-fire from an absolute time),
         it is used instead of *duration* for scheduling.
@@ -178,47 +212,39 @@ class TimerService:
             created_at=now,
             label=label,
             wake_clarvis=wake_clarvis,
+            deadline=time.monotonic() + delay,
         )
 
-        with self._lock:
-            # Cancel existing timer with the same name
-            self._cancel_handle(name)
-            self._timers[name] = timer
-            self._persist()
-
-        # Schedule on event loop (thread-safe)
-        self._loop.call_soon_threadsafe(self._schedule, name, delay)
+        self._call_on_loop(self._add_timer, timer)
         logger.info("Timer set: %s (%.1fs, recurring=%s)", name, delay, recurring)
         return timer
 
     def cancel(self, name: str) -> bool:
-        """Cancel a timer by name. Returns True if it existed."""
-        with self._lock:
-            if name not in self._timers:
-                return False
-            self._cancel_handle(name)
-            del self._timers[name]
-            self._persist()
-            logger.info("Timer cancelled: %s", name)
-            return True
+        """Cancel a timer by name. Returns True if it existed.
+
+        May be called from any thread.
+        """
+        return self._call_on_loop(self._remove_timer, name)
 
     def list_timers(self) -> list[dict]:
         """List all active timers with remaining time."""
-        now = time.time()
+        if not self._timers:  # common idle case
+            return []
+        now = time.monotonic()
         result = []
-        with self._lock:
-            for t in self._timers.values():
-                result.append(
-                    {
-                        "name": t.name,
-                        "label": t.label,
-                        "duration": t.duration,
-                        "remaining": max(0.0, t.fire_at - now),
-                        "recurring": t.recurring,
-                        "wake_clarvis": t.wake_clarvis,
-                        "created_at": datetime.fromtimestamp(t.created_at, tz=timezone.utc).isoformat(),
-                    }
-                )
+        # list() snapshots the values in one step, safe against loop-side mutation
+        for t in list(self._timers.values()):
+            result.append(
+                {
+                    "name": t.name,
+                    "label": t.label,
+                    "duration": t.duration,
+                    "remaining": max(0.0, t.deadline - now),
+                    "recurring": t.recurring,
+                    "wake_clarvis": t.wake_clarvis,
+                    "created_at": datetime.fromtimestamp(t.created_at, tz=timezone.utc).isoformat(),
+                }
+            )
         return result
 
     def start(self) -> None:
@@ -228,35 +254,34 @@ class TimerService:
         ``call_soon_threadsafe``).
         """
         self._load()
-        now = time.time()
-        with self._lock:
-            for name, timer in list(self._timers.items()):
-                remaining = timer.fire_at - now
-                if remaining <= 0:
-                    self._loop.call_soon_threadsafe(self._fire, name)
-                else:
-                    self._schedule(name, remaining)
+        now = time.monotonic()
+        for name, timer in list(self._timers.items()):
+            remaining = timer.deadline - now
+            if remaining <= 0:
+                self._loop.call_soon_threadsafe(self._fire, name)
+            else:
+                self._schedule(name, remaining)
         logger.info("TimerService started, %d timer(s) loaded", len(self._timers))
 
     def stop(self) -> None:
         """Cancel all handles and persist state."""
-        with self._lock:
-            for name in list(self._handles):
-                self._cancel_handle(name)
-            # Flush directly on stop (bypass debounce)
-            data = [asdict(t) for t in self._timers.values()]
-            self._dirty = False
-        json_save_atomic(self._state_file, data)
+        for name in list(self._handles):
+            self._cancel_handle(name)
+        if self._persist_handle is not None:
+            self._persist_handle.cancel()
+            self._persist_handle = None
+        # Flush directly on stop (bypass debounce)
+        self._dirty = False
+        self._write(*self._snapshot())
         logger.info("TimerService stopped")
 
     def _fire(self, name: str) -> None:
         """Called on the event loop when a timer expires."""
-        with self._lock:
-            timer = self._timers.get(name)
-            if timer is None:
-                return
-            # Remove handle reference (it has already fired)
-            self._handles.pop(name, None)
+        timer = self._timers.get(name)
+        if timer is None:
+            return
+        # Remove handle reference (it has already fired)
+        self._handles.pop(name, None)
 
         self._bus.emit(
             "timer:fired",
@@ -268,13 +293,54 @@ class TimerService:
         )
         logger.info("Timer fired: %s", name)
 
-        with self._lock:
-            if timer.recurring:
-                timer.fire_at = time.time() + timer.duration
-                self._schedule(name, timer.duration)
-            else:
-                self._timers.pop(name, None)
-            self._persist()
+        if timer.recurring:
+            timer.fire_at = time.time() + timer.duration
+            timer.deadline = time.monotonic() + timer.duration
+            self._schedule(name, timer.duration)
+        else:
+            self._timers.pop(name, None)
+        self._persist()
+
+    def _call_on_loop[T](self, fn: Callable[..., T], *args) -> T:
+        """Run *fn* on the event loop thread and return its result.
+
+        Calls inline when already on the loop (or before it is running);
+        otherwise schedules via ``call_soon_threadsafe`` and blocks.
+        """
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop or not self._loop.is_running():
+            return fn(*args)
+
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+        def _run() -> None:
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        self._loop.call_soon_threadsafe(_run)
+        return future.result(timeout=10.0)
+
+    def _add_timer(self, timer: Timer) -> None:
+        """Store and schedule *timer*, replacing any same-named one. Loop thread only."""
+        self._cancel_handle(timer.name)
+        self._timers[timer.name] = timer
+        self._schedule(timer.name, timer.duration)
+        self._persist()
+
+    def _remove_timer(self, name: str) -> bool:
+        """Cancel and drop a timer. Loop thread only."""
+        if name not in self._timers:
+            return False
+        self._cancel_handle(name)
+        del self._timers[name]
+        self._persist()
+        logger.info("Timer cancelled: %s", name)
+        return True
 
     def _schedule(self, name: str, delay: float) -> None:
         """Schedule a ``call_later`` handle.
@@ -286,42 +352,67 @@ class TimerService:
         self._handles[name] = handle
 
     def _cancel_handle(self, name: str) -> None:
-        """Cancel an asyncio handle if it exists. Caller must hold ``_lock``."""
+        """Cancel an asyncio handle if it exists. Loop thread only."""
         handle = self._handles.pop(name, None)
         if handle is not None:
             handle.cancel()
 
     def _persist(self) -> None:
-        """Mark dirty and schedule a flush. Caller must hold ``_lock``."""
+        """Mark dirty and schedule a debounced flush. Loop thread only."""
         if not self._dirty:
             self._dirty = True
-            self._loop.call_soon_threadsafe(self._flush_persist)
+            self._persist_handle = self._loop.call_later(_PERSIST_DELAY, self._flush_persist)
 
     def _flush_persist(self) -> None:
-        """Actually write timers to disk (runs on event loop)."""
-        with self._lock:
-            if not self._dirty:
+        """Snapshot timers on the loop and write them from the default executor."""
+        self._persist_handle = None
+        if not self._dirty:
+            return
+        if self._write_future is not None and not self._write_future.done():
+            # Previous write still in flight -- try again after another window
+            self._persist_handle = self._loop.call_later(_PERSIST_DELAY, self._flush_persist)
+            return
+        self._dirty = False
+        self._write_future = self._loop.run_in_executor(None, self._write, *self._snapshot())
+
+    def _snapshot(self) -> tuple[int, list[dict]]:
+        """Return a numbered copy of the timer state. Loop thread only."""
+        self._write_seq += 1
+        wall, mono = time.time(), time.monotonic()
+        data = []
+        for t in self._timers.values():
+            entry = asdict(t)
+            # Persist the deadline as wall time so it survives a restart
+            del entry["deadline"]
+            entry["fire_at"] = wall + (t.deadline - mono)
+            data.append(entry)
+        return self._write_seq, data
+
+    def _write(self, seq: int, data: list[dict]) -> None:
+        """Write a snapshot unless a newer one has already been written."""
+        with self._write_lock:
+            if seq <= self._written_seq:
                 return
-            data = [asdict(t) for t in self._timers.values()]
-            self._dirty = False
-        json_save_atomic(self._state_file, data)
+            if json_save_atomic(self._state_file, data):
+                self._written_seq = seq
 
     def _load(self) -> None:
         """Load timers from disk. Graceful on missing/corrupt file."""
         raw = json_load_safe(self._state_file)
         if raw is None:
             return
-        with self._lock:
-            for entry in raw:
-                wake = entry.get("wake_clarvis", False)
-                timer = Timer(
-                    name=entry["name"],
-                    duration=entry["duration"],
-                    fire_at=entry["fire_at"],
-                    recurring=entry["recurring"],
-                    created_at=entry["created_at"],
-                    label=entry["label"],
-                    wake_clarvis=wake,
-                )
-                self._timers[timer.name] = timer
+        wall, mono = time.time(), time.monotonic()
+        for entry in raw:
+            wake = entry.get("wake_clarvis", False)
+            timer = Timer(
+                name=entry["name"],
+                duration=entry["duration"],
+                fire_at=entry["fire_at"],
+                recurring=entry["recurring"],
+                created_at=entry["created_at"],
+                label=entry["label"],
+                wake_clarvis=wake,
+                deadline=mono + (entry["fire_at"] - wall),
+            )
+            self._timers[timer.name] = timer
         logger.info("Loaded %d timer(s) from %s", len(self._timers), self._state_file)
@@ -1,12 +1,21 @@
 """Weather and location services via Open-Meteo API and geolocation."""
 
 import json
+import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 
 import httpx
 from cachetools import TTLCache
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # --- Location detection ---
 
 CORELOCATION_CMD = "CoreLocationCLI"
@@ -14,6 +23,22 @@ _corelocation_available: bool | None = None
 
 # Single-entry TTL cache for location data
 _location_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+# Set after a failed IP lookup so we don't repeat its timeout every call
+_ip_failure_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+# Shared client -- keeps connections (DNS, TCP, TLS) alive across lookups
+_http: httpx.Client | None = None
+_http_lock = threading.Lock()
+
+
+def _http_client() -> httpx.Client:
+    global _http
+    if _http is None:
+        with _http_lock:  # called from executor threads
+            if _http is None:
+                _http = httpx.Client()
+    return _http
+
 
 DEFAULT_LOCATION = {
     "latitude": 37.7749,
@@ -26,13 +51,8 @@ DEFAULT_LOCATION = {
 
 def _is_corelocation_available() -> bool:
     global _corelocation_available
-    if _corelocation_available is not None:
-        return _corelocation_available
-    try:
-        result = subprocess.run(["which", CORELOCATION_CMD], capture_output=True, timeout=2)
-        _corelocation_available = result.returncode == 0
-    except (subprocess.TimeoutExpired, Exception):
-        _corelocation_available = False
+    if _corelocation_available is None:
+        _corelocation_available = shutil.which(CORELOCATION_CMD) is not None
     return _corelocation_available
 
 
@@ -41,9 +61,11 @@ def _get_location_corelocation() -> dict | None:
     if not _is_corelocation_available():
         return None
     try:
-        result = subprocess.run([CORELOCATION_CMD, "-j"], capture_output=True, text=True, timeout=15)
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
+        result = subprocess.run([CORELOCATION_CMD, "-j"], capture_output=True, timeout=15)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        data = _loads(result.stdout)
+        if isinstance(data, dict) and "latitude" in data and "longitude" in data:
             return {
                 "latitude": float(data["latitude"]),
                 "longitude": float(data["longitude"]),
@@ -53,17 +75,19 @@ def _get_location_corelocation() -> dict | None:
                 "timezone": data.get("timeZone", ""),
                 "source": "corelocation",
             }
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, Exception):
+    except Exception:
         pass
     return None
 
 
 def _get_location_ip() -> dict | None:
     """Get location via IP geolocation (fallback)."""
+    if "failed" in _ip_failure_cache:
+        return None
     try:
-        response = httpx.get("http://ip-api.com/json/", timeout=5)
+        response = _http_client().get("http://ip-api.com/json/", timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         if data.get("status") == "success":
             return {
                 "latitude": data["lat"],
@@ -74,8 +98,9 @@ def _get_location_ip() -> dict | None:
                 "timezone": data.get("timezone", ""),
                 "source": "ip",
             }
-    except httpx.HTTPError:
+    except (httpx.HTTPError, ValueError):
         pass
+    _ip_failure_cache["failed"] = True
     return None
 
 
@@ -251,9 +276,9 @@ def fetch_weather(latitude: float, longitude: float) -> WeatherData:
         f"&wind_speed_unit=mph"
     )
 
-    response = httpx.get(url, timeout=10)
+    response = _http_client().get(url, timeout=10)
     response.raise_for_status()
-    data = response.json()
+    data = _loads(response.content)
 
     current = data.get("current", {})
     weather_code = current.get("weather_code", 0)
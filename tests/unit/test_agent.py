@@ -255,3 +255,23 @@ async def test_auto_approve_extension_ui_select():
     assert responses[0]["value"] == "a"
 
     await _cancel_reader(agent)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connects_spawn_once(tmp_path, monkeypatch):
+    """Concurrent connect() callers share a single Pi spawn."""
+    agent = Agent(_make_config(project_dir=tmp_path))
+    spawned = 0
+
+    async def fake_exec(*args, **kwargs):
+        nonlocal spawned
+        spawned += 1
+        await asyncio.sleep(0.01)
+        return MagicMock(pid=1, stdout=None, stderr=None)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    await asyncio.gather(*(agent.connect() for _ in range(5)))
+
+    assert spawned == 1
+    assert agent.connected
@@ -102,3 +102,170 @@ async def test_cognee_entity_merge(store):
 
     assert result2["status"] == "ok"
     mock_engine2.add_edge.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cognee_entity_merge_multiple_duplicates(store):
+    """Edges between duplicates collapse onto the survivor instead of dangling."""
+    store._kg_ready = True
+
+    edges_by_id = {
+        "id2": [("id2", "id3", "RELATED", {}), ("id4", "id2", "KNOWS", {})],
+        "id3": [("id2", "id3", "RELATED", {}), ("id3", "id6", "WORKS_AT", {})],
+    }
+    mock_engine = AsyncMock()
+    mock_engine.get_edges = AsyncMock(side_effect=lambda nid: edges_by_id[nid])
+    mock_engine.add_edge = AsyncMock()
+    mock_engine.delete_node = AsyncMock()
+
+    with patch(
+        "cognee.infrastructure.databases.graph.get_graph_engine",
+        new_callable=AsyncMock,
+        return_value=mock_engine,
+    ):
+        result = await store.kg_merge_entities(["id1", "id2", "id3"])
+
+    assert result["merged_count"] == 2
+    added = [c.args for c in mock_engine.add_edge.await_args_list]
+    assert ("id4", "id1", "KNOWS", {}) in added
+    assert ("id1", "id6", "WORKS_AT", {}) in added
+    assert all("id2" not in a[:2] and "id3" not in a[:2] for a in added)
+
+
+@pytest.mark.asyncio
+async def test_cognee_search_cache_invalidated_by_writes(store):
+    """Repeat searches hit the cache until a graph write clears it."""
+    mock_result = MagicMock()
+    mock_result.search_result = "answer"
+    mock_result.dataset_id = None
+    mock_result.dataset_name = "ds"
+    mock_engine = AsyncMock()
+
+    with (
+        patch("cognee.search", new_callable=AsyncMock, return_value=[mock_result]) as mock_search,
+        patch(
+            "cognee.infrastructure.databases.graph.get_graph_engine",
+            new_callable=AsyncMock,
+            return_value=mock_engine,
+        ),
+    ):
+        first = await store.kg_search("q", datasets=["b", "a"])
+        first[0]["result"] = "mutated by caller"
+        second = await store.kg_search("q", datasets=["a", "b"])
+        assert mock_search.await_count == 1
+        assert second[0]["result"] == "answer"
+
+        await store.kg_delete_entity("id1")
+        await store.kg_search("q", datasets=["a", "b"])
+        assert mock_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cognee_search_coalesces_concurrent_queries(store):
+    """Concurrent identical searches share a single cognee.search call."""
+    import asyncio
+
+    mock_result = MagicMock()
+    mock_result.search_result = "answer"
+    mock_result.dataset_id = None
+    mock_result.dataset_name = "ds"
+    release = asyncio.Event()
+
+    async def slow_search(**kwargs):
+        await release.wait()
+        return [mock_result]
+
+    with patch("cognee.search", side_effect=slow_search) as mock_search:
+        tasks = [asyncio.create_task(store.kg_search("q")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert mock_search.call_count == 1
+    assert all(r[0]["result"] == "answer" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cognee_list_entities_name_filter(store):
+    """Name filter is a case-insensitive substring match, short or long."""
+    mock_engine = AsyncMock()
+    mock_engine.get_graph_data.return_value = (
+        [
+            ("id1", {"name": "Alice Smith", "type": "Person"}),
+            ("id2", {"name": "Bob", "type": "Person"}),
+            ("id3", {"name": "Smithsonian", "type": "Organization"}),
+            ("id4", {"type": "Concept"}),
+        ],
+        [],
+    )
+
+    with patch(
+        "cognee.infrastructure.databases.graph.get_graph_engine",
+        new_callable=AsyncMock,
+        return_value=mock_engine,
+    ):
+        smith = await store.kg_list_entities(name="SMITH")
+        assert [e["id"] for e in smith] == ["id1", "id3"]
+        assert [e["id"] for e in await store.kg_list_entities(name="smith", type_name="Person")] == ["id1"]
+        assert [e["id"] for e in await store.kg_list_entities(name="ob")] == ["id2"]
+        assert await store.kg_list_entities(name="smithx") == []
+
+
+@pytest.mark.asyncio
+async def test_cognee_ingest_batches_concurrent_calls(store):
+    """Concurrent ingests share one add/cognify; a failed batch retries singly."""
+    import asyncio
+
+    with (
+        patch("cognee.add", new_callable=AsyncMock) as mock_add,
+        patch("cognee.cognify", new_callable=AsyncMock) as mock_cognify,
+    ):
+        results = await asyncio.gather(*(store.kg_ingest(f"doc{i}", dataset="docs") for i in range(3)))
+        assert all(r["status"] == "ok" for r in results)
+        mock_add.assert_awaited_once_with(["doc0", "doc1", "doc2"], dataset_name="docs")
+        assert mock_cognify.await_count == 1
+
+        async def reject_bad(data, **kwargs):
+            if "bad" in data:
+                raise RuntimeError("bad document")
+
+        mock_add.reset_mock(side_effect=True)
+        mock_add.side_effect = reject_bad
+        good, bad = await asyncio.gather(
+            store.kg_ingest("good", dataset="docs"),
+            store.kg_ingest("bad", dataset="docs"),
+            return_exceptions=True,
+        )
+        assert good["status"] == "ok"
+        assert isinstance(bad, RuntimeError)
+    assert not store._kg_ingest_flushers
+
+
+@pytest.mark.asyncio
+async def test_cognee_stop_bounds_pending_ingest(store, monkeypatch):
+    """stop() waits for queued ingests, but cancels them after the timeout."""
+    import asyncio
+
+    import clarvis.memory.store as store_mod
+
+    monkeypatch.setattr(store_mod, "_KG_INGEST_STOP_TIMEOUT", 0.1)
+    store._kg_ready = True
+    ready_during_drain = []
+
+    async def hang(data, **kwargs):
+        ready_during_drain.append(store.kg_ready)
+        await asyncio.Event().wait()
+
+    with (
+        patch("cognee.add", side_effect=hang),
+        patch("cognee.cognify", new_callable=AsyncMock),
+    ):
+        ingest = asyncio.create_task(store.kg_ingest("doc", dataset="docs"))
+        await asyncio.sleep(0.1)
+        await store.stop()
+
+    assert ready_during_drain == [True]
+    assert store.kg_ready is False
+    assert not store._kg_ingest_flushers
+    with pytest.raises(asyncio.CancelledError):
+        await ingest
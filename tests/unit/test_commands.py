@@ -158,3 +158,25 @@ class TestContextRoleTag:
         msg = self._make_msg(ADMIN_UID)
         prefix = build_context_prefix(msg, registry)
         assert "[admin]" in prefix
+
+
+class TestRegistryPersistence:
+    def test_mutations_coalesce_into_one_write(self, tmp_path, monkeypatch):
+        import clarvis.channels.registry as registry_mod
+
+        writes = []
+        real_save = registry_mod.json_save_atomic
+        monkeypatch.setattr(registry_mod, "json_save_atomic", lambda p, d: writes.append(p) or real_save(p, d))
+
+        path = tmp_path / "registry.json"
+        reg = UserRegistry(path=path, admin_user_ids=[ADMIN_UID])
+        reg.register(username="a", channel=CHANNEL, channel_user_id="1")
+        reg.register(username="b", channel=CHANNEL, channel_user_id="2")
+        reg.add_org("Lab")
+        assert writes == []
+
+        assert reg.flush() is True
+        assert len(writes) == 1
+        reloaded = UserRegistry(path=path)
+        assert reloaded.is_registered(CHANNEL, "2")
+        assert reloaded.orgs == ["Lab"]
@@ -118,3 +118,72 @@ async def test_document_scan_error_resilience(tmp_path: Path):
 
     await watcher2.scan()
     assert "retry.txt" not in watcher2._hashes
+
+
+@pytest.mark.asyncio
+async def test_document_hashes_journal_replay(tmp_path: Path):
+    """Scans append to a journal; a new instance replays and compacts it."""
+    watch_dir = tmp_path / "documents"
+    watch_dir.mkdir()
+    hash_store = tmp_path / "doc_hashes.json"
+    journal = tmp_path / "doc_hashes.journal"
+    backend = AsyncMock()
+    backend.kg_ingest = AsyncMock(side_effect=lambda *a, **kw: {"status": "ok", "dataset": "documents"})
+    watcher = DocumentWatcher(watch_dir=watch_dir, memory=backend, hash_store_path=hash_store, poll_interval=60)
+
+    (watch_dir / "a.txt").write_text("a")
+    await watcher.scan()
+    (watch_dir / "b.txt").write_text("b")
+    await watcher.scan()
+    assert len(journal.read_text().splitlines()) == 2
+    assert not hash_store.exists()
+
+    with open(journal, "a") as f:
+        f.write('{"torn": ')  # interrupted append is ignored
+
+    w2 = DocumentWatcher(watch_dir=watch_dir, memory=backend, hash_store_path=hash_store, poll_interval=60)
+    assert set(w2._hashes) == {"a.txt", "b.txt"}
+    assert not journal.exists()
+    backend.kg_ingest.reset_mock()
+    assert await w2.scan() == []
+
+
+def test_document_hashes_torn_journal_tail_is_skipped(tmp_path: Path):
+    """A half-written last journal line is dropped; earlier records still apply."""
+    hash_store = tmp_path / "doc_hashes.json"
+    journal = tmp_path / "doc_hashes.journal"
+    hash_store.write_text('{"a.txt": "old", "b.txt": "b0"}')
+    # Torn mid-way through a multi-byte character, so not even valid UTF-8
+    journal.write_bytes(b'{"a.txt": "a1"}\n{"c.txt": "c1"}\n{"d\xc3')
+
+    watcher = DocumentWatcher(
+        watch_dir=tmp_path / "documents", memory=AsyncMock(), hash_store_path=hash_store, poll_interval=60
+    )
+    assert watcher._hashes == {"a.txt": "a1", "b.txt": "b0", "c.txt": "c1"}
+    assert not journal.exists()
+
+
+@pytest.mark.asyncio
+async def test_document_scan_skips_rehash_of_unmodified_files(tmp_path: Path, monkeypatch):
+    """Files whose mtime/size haven't moved since the last scan aren't re-hashed."""
+    watch_dir = tmp_path / "documents"
+    watch_dir.mkdir()
+    backend = AsyncMock()
+    backend.kg_ingest = AsyncMock(side_effect=lambda *a, **kw: {"status": "ok", "dataset": "documents"})
+    watcher = DocumentWatcher(
+        watch_dir=watch_dir, memory=backend, hash_store_path=tmp_path / "doc_hashes.json", poll_interval=60
+    )
+    hashed = []
+    real_hash = DocumentWatcher._hash_file
+    monkeypatch.setattr(watcher, "_hash_file", lambda path: hashed.append(path.name) or real_hash(path))
+
+    (watch_dir / "a.txt").write_text("a")
+    (watch_dir / "b.txt").write_text("b")
+    await watcher.scan()
+    assert sorted(hashed) == ["a.txt", "b.txt"]
+
+    hashed.clear()
+    (watch_dir / "b.txt").write_text("bb")
+    results = await watcher.scan()
+    assert hashed == ["b.txt"]
+    assert [r["file"] for r in results] == ["b.txt"]
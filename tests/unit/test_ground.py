@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock
 import pytest
 
 from clarvis.memory.ground import (
+    _grounding_cache,
     _read_grounding_files,
     build_memory_context,
 )
@@ -176,6 +177,13 @@ async def test_grounding_files_integration(tmp_path):
     text = _read_grounding_files(gdir2)
     assert text.index("First.") < text.index("Second.")
 
+    # edited and added files are picked up on the next read
+    (gdir2 / "01-first.md").write_text("First, revised.", encoding="utf-8")
+    (gdir2 / "03-third.md").write_text("Third.", encoding="utf-8")
+    text = _read_grounding_files(gdir2)
+    assert "First, revised." in text
+    assert text.endswith("Third.")
+
     # grounding files work without store
     result = await build_memory_context(None, "master", grounding_dir=gdir)
     assert "<memory_context>" in result
@@ -201,6 +209,19 @@ async def test_grounding_files_integration(tmp_path):
     assert "<memory_context>" in result
 
 
+def test_grounding_cache_is_bounded(tmp_path):
+    """Reading many grounding dirs evicts the least recently used entries."""
+    for i in range(_grounding_cache.maxsize + 4):
+        gdir = tmp_path / f"g{i}"
+        gdir.mkdir()
+        (gdir / "note.md").write_text(f"Note {i}.", encoding="utf-8")
+        assert _read_grounding_files(gdir) == f"Note {i}."
+
+    assert len(_grounding_cache) == _grounding_cache.maxsize
+    assert str(tmp_path / "g0") not in _grounding_cache
+    assert str(tmp_path / f"g{_grounding_cache.maxsize + 3}") in _grounding_cache
+
+
 @pytest.mark.asyncio(loop_scope="function")
 async def test_recent_items_in_context(tmp_path):
     """Stats, facts, and observations all appear with correct formatting."""
@@ -0,0 +1,29 @@
+"""Atomic JSON persistence -- round trip and file modes."""
+
+import os
+import stat
+
+from clarvis.core import persistence
+from clarvis.core.persistence import json_load_safe, json_save_atomic
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_save_round_trip_and_modes(tmp_path, monkeypatch):
+    # new files get the umask default, not mkstemp's 0600
+    monkeypatch.setattr(persistence, "_NEW_FILE_MODE", 0o644)
+    path = tmp_path / "nested" / "state.json"
+    assert json_save_atomic(path, {"a": [1, 2]}) is True
+    assert json_load_safe(path) == {"a": [1, 2]}
+    assert _mode(path) == 0o644
+
+    # an existing file keeps its own mode across rewrites
+    os.chmod(path, 0o640)
+    assert json_save_atomic(path, {"a": 3}) is True
+    assert json_load_safe(path) == {"a": 3}
+    assert _mode(path) == 0o640
+
+    # no tmp files left behind
+    assert [p.name for p in path.parent.iterdir()] == ["state.json"]
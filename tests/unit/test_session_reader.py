@@ -122,3 +122,51 @@ def test_handles_string_content_blocks(tmp_path):
     messages = parse_session(session_file)
     assert len(messages) == 1
     assert messages[0]["text"] == "plain string content"
+
+
+def test_limit_returns_last_messages_from_tail(tmp_path):
+    from clarvis.memory.session_reader import _tail_lines, parse_session
+
+    session_file = tmp_path / "session.jsonl"
+    _write_pi_messages(session_file, [{"role": "user", "text": f"msg {i} é"} for i in range(50)])
+    with open(session_file, "a") as f:
+        f.write(json.dumps({"type": "model_change", "id": "x"}) + "\n")
+
+    messages = parse_session(session_file, limit=3)
+    assert [m["text"] for m in messages] == ["msg 47 é", "msg 48 é", "msg 49 é"]
+    assert parse_session(session_file, limit=100) == parse_session(session_file)
+
+    lines = session_file.read_bytes().split(b"\n")
+    assert list(_tail_lines(session_file)) == lines[::-1]
+
+
+def test_reparses_after_file_changes(tmp_path):
+    from clarvis.memory.session_reader import parse_session
+
+    session_file = tmp_path / "session.jsonl"
+    _write_pi_messages(session_file, [{"role": "user", "text": "first"}])
+    first = parse_session(session_file)
+    first[0]["text"] = "mutated by caller"
+    assert parse_session(session_file) == [{"role": "user", "text": "first"}]
+
+    tail = parse_session(session_file, limit=1)
+    tail[0]["text"] = "mutated by caller"
+    assert parse_session(session_file, limit=1) == [{"role": "user", "text": "first"}]
+
+    _write_pi_messages(session_file, [{"role": "assistant", "text": "second"}])
+    assert [m["text"] for m in parse_session(session_file)] == ["first", "second"]
+    assert [m["text"] for m in parse_session(session_file, limit=1)] == ["second"]
+
+
+def test_parse_sessions_keeps_input_order(tmp_path):
+    from clarvis.memory.session_reader import parse_sessions
+
+    files = []
+    for i in range(4):
+        f = tmp_path / f"session_{i}.jsonl"
+        _write_pi_messages(f, [{"role": "user", "text": f"from {i}"}])
+        files.append(f)
+
+    parsed = parse_sessions([*files, tmp_path / "missing.jsonl"])
+    assert [m[0]["text"] for m in parsed[:4]] == ["from 0", "from 1", "from 2", "from 3"]
+    assert parsed[4] == []
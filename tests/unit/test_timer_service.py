@@ -0,0 +1,177 @@
+"""TimerService -- cross-thread mutation, persistence, restart recovery."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from clarvis.services.timer_service import TimerService, parse_duration
+
+
+def _service(loop, tmp_path) -> TimerService:
+    ctx = SimpleNamespace(bus=MagicMock(), loop=loop)
+    return TimerService(ctx, state_file=tmp_path / "timers.json")
+
+
+def _names(svc: TimerService) -> set[str]:
+    return {t["name"] for t in svc.list_timers()}
+
+
+# ── Cross-thread set/cancel ──────────────────────────────────
+
+
+def test_set_and_cancel_before_loop_runs(tmp_path):
+    """Before the loop is running, mutations apply inline on the caller."""
+    loop = asyncio.new_event_loop()
+    try:
+        svc = _service(loop, tmp_path)
+        svc.set_timer("tea", 60)
+        assert _names(svc) == {"tea"}
+        assert svc.cancel("tea") is True
+        assert svc.cancel("tea") is False
+        assert svc.list_timers() == []
+    finally:
+        loop.close()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_set_and_cancel_on_loop_inline(tmp_path):
+    """On the loop thread, mutations run inline and are visible immediately."""
+    svc = _service(asyncio.get_running_loop(), tmp_path)
+    svc.set_timer("tea", 60)
+    assert _names(svc) == {"tea"}
+    assert svc.cancel("tea") is True
+    assert svc.list_timers() == []
+    svc.stop()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_set_and_cancel_from_worker_threads(tmp_path):
+    """Off-loop callers are marshalled onto the running loop and block until applied."""
+    loop = asyncio.get_running_loop()
+    svc = _service(loop, tmp_path)
+    loop_thread = threading.get_ident()
+    mutated_on: set[int] = set()
+    real_add = svc._add_timer
+
+    def _add(timer):
+        mutated_on.add(threading.get_ident())
+        real_add(timer)
+
+    svc._add_timer = _add
+
+    def _worker(i: int) -> None:
+        svc.set_timer(f"t{i}", 60 + i)
+        # The change is applied by the time set_timer returns
+        assert f"t{i}" in _names(svc)
+        if i % 2:
+            assert svc.cancel(f"t{i}") is True
+
+    await asyncio.gather(*(asyncio.to_thread(_worker, i) for i in range(8)))
+
+    assert mutated_on == {loop_thread}
+    assert _names(svc) == {"t0", "t2", "t4", "t6"}
+    assert set(svc._handles) == _names(svc)
+    assert await asyncio.to_thread(svc.cancel, "missing") is False
+    svc.stop()
+
+
+# ── Debounced persistence ────────────────────────────────────
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    import clarvis.services.timer_service as timer_mod
+
+    recorded: list[list[dict]] = []
+    real_save = timer_mod.json_save_atomic
+    monkeypatch.setattr(timer_mod, "json_save_atomic", lambda p, d: recorded.append(d) or real_save(p, d))
+    return recorded
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_burst_of_changes_is_one_write_of_final_state(tmp_path, writes):
+    svc = _service(asyncio.get_running_loop(), tmp_path)
+    svc.set_timer("a", 60)
+    svc.set_timer("b", 60)
+    svc.cancel("a")
+    svc.set_timer("c", 60, label="last")
+    assert writes == []
+
+    await asyncio.sleep(0.3)
+    await svc._write_future
+
+    assert len(writes) == 1
+    assert {e["name"]: e["label"] for e in writes[0]} == {"b": "", "c": "last"}
+    on_disk = json.loads((tmp_path / "timers.json").read_text())
+    assert {e["name"] for e in on_disk} == {"b", "c"}
+    svc.stop()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_stop_flushes_pending_write(tmp_path, writes):
+    loop = asyncio.get_running_loop()
+    svc = _service(loop, tmp_path)
+    svc.set_timer("a", 60)
+    svc.set_timer("b", 60, label="final")
+    svc.stop()
+
+    assert len(writes) == 1
+    assert {e["name"]: e["label"] for e in writes[0]} == {"a": "", "b": "final"}
+
+    # The cancelled debounce never fires a second write
+    await asyncio.sleep(0.3)
+    assert len(writes) == 1
+    reloaded = _service(loop, tmp_path)
+    reloaded._load()
+    assert set(reloaded._timers) == {"a", "b"}
+
+
+# ── Restart recovery ─────────────────────────────────────────
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_reload_restores_remaining_and_fires_expired(tmp_path):
+    loop = asyncio.get_running_loop()
+    svc = _service(loop, tmp_path)
+    svc.set_timer("long", 120, label="keep")
+    svc.stop()
+
+    # Add a timer whose fire time passed while the daemon was down
+    state = json.loads((tmp_path / "timers.json").read_text())
+    expired = {**state[0], "name": "missed", "fire_at": time.time() - 5}
+    (tmp_path / "timers.json").write_text(json.dumps([*state, expired]))
+
+    restarted = _service(loop, tmp_path)
+    restarted.start()
+    timers = {t["name"]: t for t in restarted.list_timers()}
+    assert 118 < timers["long"]["remaining"] <= 120
+    assert timers["long"]["label"] == "keep"
+
+    # The expired one-shot fires on the next loop pass and is dropped
+    await asyncio.sleep(0.01)
+    restarted._bus.emit.assert_called_once()
+    assert restarted._bus.emit.call_args.kwargs["name"] == "missed"
+    assert _names(restarted) == {"long"}
+    restarted.stop()
+
+
+# ── Duration parsing ─────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "text, seconds",
+    [("45", 45.0), ("90s", 90.0), ("5m", 300.0), ("1.5h", 5400.0), ("1h30m", 5400.0), ("2h30m15s", 9015.0)],
+)
+def test_parse_duration(text, seconds):
+    assert parse_duration(text) == seconds
+
+
+@pytest.mark.parametrize("text", ["", "0", "0.0s", "soon", "99999999999999999999", "99999999999999999999m"])
+def test_parse_duration_rejects(text):
+    with pytest.raises(ValueError):
+        parse_duration(text)